@@ -8,13 +8,13 @@ Created on Thu Apr 16 09:48:04 2020
 
 
 # standard libs
+import logging
 
 # third-party libs
 
 # local modules/libs
 from .basepeak import BasePeak
 from .referencepeak import ReferencePeak
-from dialog_messages import information_normalizationFactorUndefined, information_normalizationOffsetUndefined
 
 # Enums
 from c_enum.error_code import ERROR_CODE as ERR
@@ -26,10 +26,15 @@ DEFAULT_NORM_OFFSET = 0.0
 
 
 class Peak(BasePeak):
+    # Called (without arguments) if a default normalization factor/offset is applied, e.g. to
+    # inform the user in the GUI. The core must not depend on PyQt.
+    onDefaultNormFactor = None
+    onDefaultNormOffset = None
 
     def __init__(self, name:str, centralWavelength:float, shiftUp:float, shiftDown:float, normalizationFactor:float=None, normalizationOffset:float=None, normalizationFactorSquared:float=None, **kwargs):
 
         super().__init__(centralWavelength, shiftUp, shiftDown)
+        self._logger = logging.getLogger(self.__class__.__name__)
         if name is None:
             raise ValueError ("Name cannot be None.")
         self.name = name
@@ -96,14 +101,18 @@ class Peak(BasePeak):
 
 
     def default_norm_factor(self, default:float):
-        """Prompt the user and set the default."""
-        information_normalizationFactorUndefined()
+        """Inform the user and set the default."""
+        self._logger.warning("No valid normalization factor of peak '%s' defined. Default: %s.", self.name, default)
+        if Peak.onDefaultNormFactor is not None:
+            Peak.onDefaultNormFactor()
         return default
 
 
     def default_norm_offset(self):
-        """Prompt the user and set the default."""
-        information_normalizationOffsetUndefined()
+        """Inform the user and set the default."""
+        self._logger.warning("No valid normalization offset of peak '%s' defined. Default: %s.", self.name, DEFAULT_NORM_OFFSET)
+        if Peak.onDefaultNormOffset is not None:
+            Peak.onDefaultNormOffset()
         return DEFAULT_NORM_OFFSET
 
 
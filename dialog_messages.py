@@ -127,6 +127,26 @@ def information_exportNoSpectrum(parent:QWidget=None)->None:
     QMessageBox.information(parent, title, text);
 
 
+## question
+
+def question_resumeExport(parent:QWidget=None)->bool:
+    """Asks whether an interrupted export shall be resumed."""
+    title = "Resume export?"
+    text = "The previous export of these files was interrupted. Resume it?"\
+        " Otherwise the batchfile is overwritten."
+    answer = QMessageBox.question(parent, title, text)
+    return answer == QMessageBox.Yes
+
+
+def question_updateExport(parent:QWidget=None)->bool:
+    """Asks whether only new and modified files shall be exported into the batchfile."""
+    title = "Update batchfile?"
+    text = "The batchfile contains a previous export. Analyze only new and modified files?"\
+        " Otherwise all files are analyzed again."
+    answer = QMessageBox.question(parent, title, text)
+    return answer == QMessageBox.Yes
+
+
 # Dialogs
 
 def dialog_spectra(parent:QWidget=None)->list:
@@ -24,6 +24,11 @@ class ConfigLoader(YamlLoader, metaclass=Singleton):
 
     ### Properties - Getter & Setter
 
+    @property
+    def path(self)->str:
+        """The path of the loaded configuration."""
+        return self._path
+
     @property
     def BATCH(self) -> dict:
         """Get the BATCH-configuration."""
@@ -60,6 +65,27 @@ class ConfigLoader(YamlLoader, metaclass=Singleton):
         self.config["GENERAL"]["LOG_FILE"] = logfile
 
 
+    @property
+    def spectrumCacheDir(self)->str:
+        # The cache of parsed spectra is disabled by default.
+        return self.GENERAL.get("SPECTRUM_CACHE_DIR")
+
+    @property
+    def spectrumCacheSize(self)->int:
+        """Maximum size of the spectrum cache in MB."""
+        return self.GENERAL.get("SPECTRUM_CACHE_SIZE_MB", 500)
+
+    @property
+    def resultCacheDir(self)->str:
+        # The cache of analysis results is disabled by default.
+        return self.GENERAL.get("RESULT_CACHE_DIR")
+
+    @property
+    def resultCacheSize(self)->int:
+        """Maximum size of the result cache in MB."""
+        return self.GENERAL.get("RESULT_CACHE_SIZE_MB", 200)
+
+
     @property
     def wavelength(self):
         return self.SETTINGS["WL"]
@@ -88,6 +114,16 @@ class ConfigLoader(YamlLoader, metaclass=Singleton):
         self.config["SETTINGS"]["CALIBRATION"] = cal
 
 
+    @property
+    def processes(self)->int:
+        # Providing a default value for backwards compatibility.
+        return self.BATCH.get("PROCESSES", 1)
+
+    @processes.setter
+    def processes(self, processes:int):
+        self.config["BATCH"]["PROCESSES"] = processes
+
+
     @property
     def PRESELECT_FITTING(self):
         return self.FITTING["PRESELECT_FITTING"]
@@ -112,3 +148,12 @@ class ConfigLoader(YamlLoader, metaclass=Singleton):
         if not os.path.exists(path):
             shutil.copyfile(self.DEFAULT_CONFIG, path)
         super().__init__(path)
+
+
+def init_worker(path:str)->None:
+    """
+    Loads the given configuration in a worker process (initializer of a process pool).
+
+    Must be called before modules which access the configuration on import are imported.
+    """
+    ConfigLoader(path)
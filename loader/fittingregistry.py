@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Registry of the parsed fitting files.
+
+Each fitting file is parsed once and the Fitting is cached by path and modification time.
+A modified file is parsed again on the next request. Changes reported by the watchdog can
+also be invalidated explicitly.
+
+Usage:
+    from loader.fittingregistry import FittingRegistry
+    fitting = FittingRegistry().get_fitting(path)
+
+Created on Sun Oct 18 09:12:37 2026
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+import logging
+import os
+from dataclasses import dataclass
+
+# third-party libs
+
+# local modules/libs
+from c_metaclass.singleton import Singleton
+from loader.yamlloader import YamlLoader
+from modules.dataanalysis.fitting import Fitting
+
+
+@dataclass
+class FittingEntry():
+    modificationTime: int
+    config: dict
+    fitting: Fitting = None
+
+
+class FittingRegistry(metaclass=Singleton):
+
+    ### __methods__
+
+    def __init__(self)->None:
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._entries = {}
+
+
+    ### Methods
+
+    def get_fitting(self, path:str)->Fitting:
+        """
+        The Fitting of the file. The Fitting is shared and must not be modified.
+
+        Raises AttributeError if the file does not contain a configuration (like Fitting).
+        """
+        entry = self._get_entry(path)
+        if entry.fitting is None:
+            entry.fitting = Fitting(entry.config, os.path.basename(path))
+        return entry.fitting
+
+
+    def get_name(self, path:str, default:str=None)->str:
+        """The name of the fitting as defined in the file (without setting up the Fitting)."""
+        config = self._get_entry(path).config or {}
+        return config.get("NAME", default)
+
+
+    def invalidate(self, path:str)->None:
+        """The file is parsed again on the next request."""
+        if self._entries.pop(os.path.abspath(path), None):
+            self._logger.info("Fitting file modified: %s", path)
+
+
+    def _get_entry(self, path:str)->FittingEntry:
+        path = os.path.abspath(path)
+        try:
+            modificationTime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            modificationTime = None
+
+        entry = self._entries.get(path)
+        if entry is None or entry.modificationTime != modificationTime:
+            entry = FittingEntry(modificationTime, YamlLoader(path).config)
+            self._entries[path] = entry
+        return entry
@@ -22,13 +22,16 @@ from ui.UImain import UIMain
 import dialog_messages as dialog
 import modules.universal as uni
 from .batchanalysis import BatchAnalysis
+from .dataanalysis import resultcache
 from .dataanalysis.spectrum import Spectrum
 from .dataanalysis.spectrumhandler import SpectrumHandler
+from .dataanalysis.qspectrumhandler import QSpectrumHandler
 from .filehandling.filereading.filereader import FileReader
 from .filehandling.filewriting.spectrumwriter import SpectrumWriter
 
 # enums
 from c_types.basicsetting import BasicSetting
+from c_types.peak import Peak
 from c_enum.export_type import EXPORT_TYPE
 from c_enum.characteristic import CHARACTERISTIC as CHC
 
@@ -103,12 +106,17 @@ class AnalysisWindow(QMainWindow):
         super().__init__()
         self._logger = logging.getLogger(self.__class__.__name__)
 
+        # Inform the user about defaults of the fittings (loaded by the UI).
+        Peak.onDefaultNormFactor = dialog.information_normalizationFactorUndefined
+        Peak.onDefaultNormOffset = dialog.information_normalizationOffsetUndefined
+
         # Defaults.
         self._activeFile = None
 
         ## Set up the UI
         self.window = UIMain(self)
         self.batch = BatchAnalysis(self)
+        self.spectrumHandler = QSpectrumHandler()
 
         self.__post_init__()
 
@@ -148,6 +156,7 @@ class AnalysisWindow(QMainWindow):
 
         self.wavelengthChanged.connect(win.show_diff_wavelength)
         self.fileChanged.connect(win.update_fileinformation)
+        self.spectrumHandler.pixelDataTriggered.connect(win.enable_dispersion)
 
 
     ### Events
@@ -252,15 +261,19 @@ class AnalysisWindow(QMainWindow):
         if not isFileReloaded:
             self._set_wavelength_from_file(file)
 
+        invertSpectrum = self.setting.invertSpectrum
+        baseline = resultcache.load_baseline(file.filename, invertSpectrum)
         try:
-            specHandler = SpectrumHandler(file, self.setting, slotPixel=self.window.enable_dispersion)
+            specHandler = self.spectrumHandler.analyze(file, self.setting, baseline=baseline)
         except InvalidSpectrumError:
             if not silent:
                 dialog.critical_invalidSpectrum()
             return
+        if baseline is None:
+            resultcache.store_baseline(file.filename, invertSpectrum, specHandler.baseline)
 
         try:
-            specHandler.fit_data(self.setting.selectedFitting)
+            resultcache.fit_data(specHandler, file.filename, self.setting.selectedFitting)
         except CalibrationError as e:
             self._logger.warning(f"{file.filename}: {e}")
 
@@ -30,9 +30,10 @@ import modules.universal as uni
 import dialog_messages as dialog
 from .dataanalysis.trace import Trace
 from .watchdog import Watchdog
-from .filehandling.filereading.bareader import BaReader
+from .filehandling.filereading.bareader import BaTailReader
 from .filehandling.filereading.filereader import FileReader
 from .thread.appender import Appender
+from .batchexport import has_checkpoint, has_index
 from .thread.exporter import Exporter
 from .thread.plotter import Plotter
 
@@ -129,6 +130,7 @@ class BatchAnalysis(QDialog):
         # Init the props to prevent errors in the ui-init routine.
         # (SystemError: <built-in function connectSlotsByName> returned a result with an error set)
         self._batchFile = None
+        self._batchReader = None
         self._thread = None
         self.currentFile = None
         self.setting = None
@@ -259,7 +261,8 @@ class BatchAnalysis(QDialog):
     def analyze_single_file(self, filename:str)->None:
         thread = Appender()
         thread.fileValidated.connect(self.add_file)
-        # thread.importBatchTriggered.connect(self.update_batch)
+        # Only the appended rows are read.
+        thread.importBatchTriggered.connect(self.update_batch)
         # self.cancelInitiated.connect(thread.cancel_job)
         thread.append(filename, self.batchFile, self.setting)
 
@@ -288,12 +291,14 @@ class BatchAnalysis(QDialog):
             self._thread.plot(files)
 
         if isExportBatch:
+            resume = has_checkpoint(files, self.batchFile, self.setting) and dialog.question_resumeExport()
+            incremental = not resume and has_index(self.batchFile) and dialog.question_updateExport()
             self._thread = Exporter()
             self.cancelInitiated.connect(self._thread.cancel_job)
             self._thread.finished.connect(self.update_batch)
             self._thread.progressChanged.connect(self._window.set_progress_bar)
             self._thread.skippedFilesTriggered.connect(self.handle_skipped_files)
-            self._thread.export(files, self.batchFile, self.setting)
+            self._thread.export(files, self.batchFile, self.setting, resume=resume, incremental=incremental)
 
 
     def import_batchfile(self, takeCurrentBatchfile:bool=False)->None:
@@ -301,24 +306,37 @@ class BatchAnalysis(QDialog):
         filename = self._determine_batchfilename(takeCurrentBatchfile)
         if not filename:
             return
+        characteristic = self._window.traceSelection
         try:
-            batch = BaReader(filename=filename)
+            batch = self._read_batchfile(filename, characteristic)
         except (FileNotFoundError, InvalidBatchFileError):
             self._logger.info(f"Could not read batchfile: {filename}")
             return
 
-        characteristic = self._window.traceSelection
-        self._format_batchdata(batch, characteristic)
-        self._plot_data(batch.data, characteristic)
+        traceData = self._format_batchdata(batch, characteristic)
+        self._plot_data(traceData, characteristic)
+
+
+    def _read_batchfile(self, filename:str, characteristic:str)->BaTailReader:
+        """Reads the batchfile. Of the previously read batchfile only the appended rows are read."""
+        batch = self._batchReader
+        if batch is not None and batch.filename == filename and batch.characteristic == characteristic:
+            batch.update()
+        else:
+            self._batchReader = None
+            batch = BaTailReader(filename=filename, characteristic=characteristic)
+            self._batchReader = batch
+        return batch
 
 
-    def _format_batchdata(self, batch:BaReader, characteristic:str)->None:
+    def _format_batchdata(self, batch:BaTailReader, characteristic:str)->dict:
         self._traceSpectrum.reset_time()
+        traceData = {}
         for peak in batch.data.keys():
             timestamps, values = batch.get_data(peak, characteristic)
             diffTimes = self._traceSpectrum.calculate_time_differences(timestamps)
-            traceData = np.stack((diffTimes, values), axis=1)
-            batch.data[peak] = traceData
+            traceData[peak] = np.stack((diffTimes, values), axis=1)
+        return traceData
 
 
     def _plot_data(self, data:dict, label:str)->None:
@@ -379,7 +397,8 @@ class BatchAnalysis(QDialog):
         filename = self._get_indexed_filename(index)
 
         if filename:
-            selectedFile = FileReader(filename)
+            # The data are read when the spectrum is analyzed by the receiver.
+            selectedFile = FileReader(filename, lazy=True)
             dogAlive = self._dog.is_alive()
             self.fileSelected.emit(selectedFile, dogAlive)
             self._traceSpectrum.plot_referencetime_of_spectrum(*selectedFile.fileinformation)
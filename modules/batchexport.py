@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Batch export without any ui.
+
+Analyzes multiple spectra and exports the characteristic values into a batchfile. Used by
+the Exporter thread of the batch analysis and by the headless batch analysis (oes_spa_batch.py).
+Therefore, this module (and its imports) must not depend on PyQt.
+
+Usage:
+    from modules.batchexport import export_batch
+    skippedFiles, noAnalyzedFiles = export_batch(files, batchFile, setting)
+    # Continue an interrupted export.
+    skippedFiles, noAnalyzedFiles = export_batch(files, batchFile, setting, resume=True)
+    # Analyze new and modified files only.
+    skippedFiles, noAnalyzedFiles = update_batch(files, batchFile, setting)
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+import csv
+import glob
+import hashlib
+import json
+import logging
+import os
+
+# third-party libs
+from dependencies.natsort.natsort import natsorted
+
+# local modules/libs
+import modules.universal as uni
+import modules.dataanalysis.analysis as Analysis
+from .dataanalysis.resultcache import setting_fingerprint
+from .filehandling.filereading.filereader import frame_source
+from .filehandling.filewriting.batchwriter import BatchWriter
+from loader.configloader import ConfigLoader
+from loader.fittingregistry import FittingRegistry
+
+# types
+from c_types.basicsetting import BasicSetting
+
+# enums
+from c_enum.characteristic import CHARACTERISTIC as CHC
+
+
+logger = logging.getLogger(__name__)
+
+# constants
+CHECKPOINT_SUFFIX = ".checkpoint"
+INDEX_SUFFIX = ".index"
+# Number of rows written into the batchfile at once.
+ROWS_PER_CHUNK = 1000
+
+
+def export_batch(files:list, batchFile:str, setting:BasicSetting, processes:int=1,
+                 progress=None, isCancelled=None, resume:bool=False)->tuple:
+    """
+    Analyzes the files and exports the results into the batchfile.
+
+    The rows are written in chunks of ROWS_PER_CHUNK while the files are analyzed. A checkpoint
+    is recorded after each chunk, a cancelled or crashed export can be resumed from there.
+
+    Parameters
+    ----------
+    processes : int, optional (default 1)
+        Number of worker processes (None or 0: all available cores).
+    progress : callable, optional
+        Called with the progress (0, 1] after each file.
+    isCancelled : callable, optional
+        Polled after each file. The analysis is cancelled if it returns True.
+    resume : bool, optional (default False)
+        Resumes the interrupted export of the same files and setting (if any). The batchfile is
+        overwritten otherwise.
+
+    Returns
+    -------
+    skippedFiles : list
+        Files which could not be analyzed.
+    noAnalyzedFiles : int
+        Number of files analyzed by this call and written into the batchfile. Files of a resumed
+        export analyzed before are not counted.
+
+    """
+    files = list(files)
+    amount = len(files)
+    # Determined before the analysis: Files modified meanwhile are analyzed again by an update.
+    states = file_states(files)
+
+    index = BatchIndex(batchFile)
+    stream = BatchStream(batchFile, ExportCheckpoint(batchFile, states, setting))
+    if resume and stream.resume():
+        logger.info("Resume export at file %i of %i.", stream.noFiles + 1, amount)
+        if progress is not None and amount:
+            progress(stream.noFiles / amount)
+    else:
+        stream.checkpoint.remove()
+        index.remove()
+
+    isComplete = False
+    results = Analysis.analyze_files(files[stream.noFiles:], setting, processes)
+    try:
+        for file, result in results:
+            if isCancelled is not None and isCancelled():
+                break
+            stream.add(file, result)
+            if progress is not None:
+                progress(stream.noFiles / amount)
+        else:
+            isComplete = True
+    finally:
+        # Cancels the pending jobs.
+        results.close()
+        stream.close(isComplete)
+
+    if isComplete:
+        index.save(index_entries(states, setting_fingerprint(setting), stream.skippedFiles))
+    return stream.skippedFiles, stream.noAnalyzedFiles
+
+
+def update_batch(files:list, batchFile:str, setting:BasicSetting, processes:int=1,
+                 progress=None, isCancelled=None)->tuple:
+    """
+    Updates the batchfile by analyzing the new and modified files only.
+
+    Files are up to date if their size, modification time and the setting (incl. fittings)
+    match the index of the batchfile. The rows of other files are removed, the rows of the
+    analyzed files are added. The rows are sorted by the timestamp of the spectra.
+
+    Falls back to a full export if the batchfile was not exported with an index (or the
+    columns changed). The batchfile is replaced once the analysis is complete, it is left
+    untouched if the update is cancelled.
+
+    Parameters and return value as for export_batch. Up to date files are not counted as
+    analyzed, no file is counted if the update is cancelled.
+
+    """
+    files = list(files)
+    amount = len(files)
+
+    index = BatchIndex(batchFile)
+    entries = index.load()
+    titles = BatchWriter(batchFile).read_column_titles()
+    if not entries or titles is None:
+        logger.info("Batchfile without index, analyze all files: %s", batchFile)
+        return export_batch(files, batchFile, setting, processes, progress, isCancelled)
+
+    key = setting_fingerprint(setting)
+    states = file_states(files)
+    upToDate = {file for file in files if is_up_to_date(entries.get(file), states[file], key)}
+    pendingFiles = [file for file in files if file not in upToDate]
+    logger.info("%i of %i files are up to date.", len(upToDate), amount)
+
+    skippedFiles = [file for file in files if file in upToDate and entries[file]["skipped"]]
+    rows = read_rows(batchFile, upToDate)
+    if progress is not None and amount:
+        progress(len(upToDate) / amount)
+
+    noAnalyzedFiles = 0
+    results = Analysis.analyze_files(pendingFiles, setting, processes)
+    try:
+        for noFiles, (file, result) in enumerate(results, start=len(upToDate) + 1):
+            if isCancelled is not None and isCancelled():
+                return skippedFiles, 0
+            if result is None:
+                skippedFiles.append(file)
+            else:
+                fileData, header = result
+                if header and list(header) != titles:
+                    logger.warning("Columns of the batchfile changed, analyze all files.")
+                    results.close()
+                    return export_batch(files, batchFile, setting, processes, progress, isCancelled)
+                rows.extend(fileData)
+                noAnalyzedFiles += 1
+            if progress is not None:
+                progress(noFiles / amount)
+    finally:
+        results.close()
+
+    timeColumn = titles.index(CHC.HEADER_INFO.value)
+    rows.sort(key=lambda row: row_timestamp(row, timeColumn))
+    replace_batchfile(batchFile, rows, titles)
+    index.save(index_entries(states, key, skippedFiles))
+    return skippedFiles, noAnalyzedFiles
+
+
+def read_rows(batchFile:str, files:set)->list:
+    """The rows of the batchfile which belong to the files (incl. the frames of a series)."""
+    rows = []
+    with open(batchFile, "r", newline="") as f:
+        fReader = csv.reader(f, dialect=BatchWriter(batchFile).dialect)
+        for row in fReader:
+            if CHC.FILENAME.value in row:
+                fileColumn = row.index(CHC.FILENAME.value)
+                break
+        else:
+            return rows
+
+        for row in fReader:
+            try:
+                filename = row[fileColumn]
+            except IndexError:
+                continue
+            if filename in files or frame_source(filename) in files:
+                rows.append(row)
+    return rows
+
+
+def row_timestamp(row:list, column:int)->tuple:
+    """Sort key of the row by the timestamp. Rows without a valid timestamp first."""
+    try:
+        return (1, uni.timestamp_from_string(str(row[column])))
+    except (IndexError, ValueError):
+        return (0, )
+
+
+def replace_batchfile(batchFile:str, rows:list, titles:list)->None:
+    """Writes the rows into a temporary file first, which replaces the batchfile afterwards."""
+    tmpFilename = batchFile + ".tmp"
+    BatchWriter(tmpFilename).export(rows, titles)
+    os.replace(tmpFilename, batchFile)
+
+
+class BatchStream():
+    """
+    Writes the results of the analysis in chunks into the batchfile.
+
+    The header is written with the first result. A checkpoint is recorded after each chunk and
+    removed if the export is complete.
+    """
+
+    ### __methods__
+
+    def __init__(self, batchFile:str, checkpoint:"ExportCheckpoint")->None:
+        self.writer = BatchWriter(batchFile)
+        self.checkpoint = checkpoint
+        self.header = None
+        self.rows = []
+        self.skippedFiles = []
+        # Number of files added to the stream (incl. a resumed checkpoint).
+        self.noFiles = 0
+        # Number of files with results added by this stream.
+        self.noAnalyzedFiles = 0
+
+
+    ### Methods
+
+    def resume(self)->bool:
+        """Continues at the checkpoint. Returns False if no (valid) checkpoint exists."""
+        state = self.checkpoint.load()
+        if state is None:
+            return False
+
+        # Rows written after the checkpoint are written again.
+        with open(self.writer.filename, "r+b") as batchFile:
+            batchFile.truncate(state["offset"])
+        self.header = state["header"]
+        self.skippedFiles = state["skipped"]
+        self.noFiles = state["files"]
+        return True
+
+
+    def add(self, file:str, result:tuple)->None:
+        self.noFiles += 1
+        if result is None:
+            self.skippedFiles.append(file)
+            return
+
+        self.noAnalyzedFiles += 1
+        fileData, header = result
+        if self.header is None and header:
+            self.header = header
+            self.writer.export([], header)
+        self.rows.extend(fileData)
+        if len(self.rows) >= ROWS_PER_CHUNK:
+            self.flush()
+
+
+    def flush(self)->None:
+        """Writes the pending rows and records the checkpoint."""
+        if self.header is None:
+            return
+        if self.rows:
+            self.writer.append_data(self.rows)
+            self.rows = []
+        offset = os.path.getsize(self.writer.filename)
+        self.checkpoint.save(self.noFiles, offset, self.header, self.skippedFiles)
+
+
+    def close(self, isComplete:bool)->None:
+        self.flush()
+        if self.header is None:
+            # No results at all: An empty batchfile.
+            self.writer.export([], [])
+        if isComplete:
+            self.checkpoint.remove()
+
+
+class ExportCheckpoint():
+    """
+    The progress of an export in a sidecar of the batchfile (JSON).
+
+    The checkpoint is valid for the same unmodified files and setting only.
+    """
+
+    ### __methods__
+
+    def __init__(self, batchFile:str, states:dict, setting:BasicSetting)->None:
+        self.batchFile = batchFile
+        self.filename = batchFile + CHECKPOINT_SUFFIX
+        self.key = export_key(states, setting)
+
+
+    ### Methods
+
+    def load(self)->dict:
+        """The state of the checkpoint, None if there is no valid checkpoint."""
+        try:
+            with open(self.filename, "r") as checkpointFile:
+                state = json.load(checkpointFile)
+            isValid = (state["key"] == self.key and os.path.getsize(self.batchFile) >= state["offset"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return state if isValid else None
+
+
+    def save(self, noFiles:int, offset:int, header:list, skippedFiles:list)->None:
+        state = {
+            "key": self.key,
+            "files": noFiles,
+            "offset": offset,
+            "header": header,
+            "skipped": skippedFiles,
+        }
+        tmpFilename = self.filename + ".tmp"
+        with open(tmpFilename, "w") as checkpointFile:
+            json.dump(state, checkpointFile)
+        os.replace(tmpFilename, self.filename)
+
+
+    def remove(self)->None:
+        try:
+            os.remove(self.filename)
+        except FileNotFoundError:
+            pass
+
+
+class BatchIndex():
+    """
+    The files exported into a batchfile in a sidecar of the batchfile (JSON).
+
+    Each file is recorded with its size, modification time, the key of the setting and whether
+    it was skipped.
+    """
+
+    ### __methods__
+
+    def __init__(self, batchFile:str)->None:
+        self.filename = batchFile + INDEX_SUFFIX
+
+
+    ### Methods
+
+    def load(self)->dict:
+        """The entries of the files, empty if there is no (valid) index."""
+        try:
+            with open(self.filename, "r") as indexFile:
+                entries = json.load(indexFile)["files"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+
+    def save(self, entries:dict)->None:
+        tmpFilename = self.filename + ".tmp"
+        with open(tmpFilename, "w") as indexFile:
+            json.dump({"files": entries}, indexFile)
+        os.replace(tmpFilename, self.filename)
+
+
+    def remove(self)->None:
+        try:
+            os.remove(self.filename)
+        except FileNotFoundError:
+            pass
+
+
+def file_states(files:list)->dict:
+    """(size, modification time) of each file, None if not accessible."""
+    states = {}
+    for file in files:
+        try:
+            stat = os.stat(file)
+            states[file] = [stat.st_size, stat.st_mtime_ns]
+        except OSError:
+            states[file] = None
+    return states
+
+
+def index_entries(states:dict, key:str, skippedFiles:list)->dict:
+    skippedFiles = set(skippedFiles)
+    return {file: {"state": state, "key": key, "skipped": file in skippedFiles}
+            for file, state in states.items() if state is not None}
+
+
+def is_up_to_date(entry:dict, state:list, key:str)->bool:
+    try:
+        return state is not None and entry["state"] == state and entry["key"] == key
+    except (KeyError, TypeError):
+        return False
+
+
+def has_index(batchFile:str)->bool:
+    return bool(BatchIndex(batchFile).load())
+
+
+def export_key(states:dict, setting:BasicSetting)->str:
+    """
+    Identifies an export by the files, their states (see file_states) and the setting.
+
+    A file modified after the checkpoint invalidates the checkpoint: Its rows might be
+    written already.
+    """
+    identity = [list(states.items()), setting_fingerprint(setting)]
+    return hashlib.sha1(json.dumps(identity).encode("utf-8")).hexdigest()
+
+
+def has_checkpoint(files:list, batchFile:str, setting:BasicSetting)->bool:
+    """Checks whether an interrupted export of the files and setting can be resumed."""
+    return ExportCheckpoint(batchFile, file_states(files), setting).load() is not None
+
+
+def collect_files(paths:list)->list:
+    """
+    Collects the spectra of the given directories, files and glob patterns.
+
+    Directories are not searched recursively. Returns a natsorted list of unique files
+    with a valid suffix.
+    """
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            candidates = (os.path.join(path, f) for f in os.listdir(path))
+        else:
+            candidates = glob.glob(path)
+        files.update(f for f in candidates if os.path.isfile(f) and uni.is_valid_suffix(f))
+    return natsorted(files)
+
+
+def load_fittings(filenames:list)->list:
+    """Loads the fittings of the given files. Invalid fittings are omitted."""
+    fittings = []
+    for filename in filenames:
+        fitting = FittingRegistry().get_fitting(filename)
+        if not fitting.is_valid():
+            logger.warning("Invalid fitting omitted: %s", filename)
+            continue
+        fittings.append(fitting)
+    return fittings
+
+
+def checked_fitting_files()->list:
+    """Gets the files of the fittings which are checked in the configuration."""
+    config = ConfigLoader()
+    directory = config.FITTING["DIR"]
+    checkedNames = config.CHECKED_FITTINGS
+
+    fittingFiles = []
+    for file in sorted(os.listdir(directory)):
+        if file.rfind(config.FITTING["FILE_PATTERN"]) == -1:
+            continue
+        path = os.path.join(directory, file)
+        if FittingRegistry().get_name(path) in checkedNames:
+            fittingFiles.append(path)
+    return fittingFiles
+
+
+def setting_from_config(fittings:list, **kwargs)->BasicSetting:
+    """
+    Sets up a BasicSetting as the main window does on start up.
+
+    The wavelength, dispersion and calibration are taken from the configuration. All values
+    may be overwritten by kwargs (e.g. normalizeData=True).
+    """
+    config = ConfigLoader()
+    setting = {
+        "wavelength": config.wavelength,
+        "dispersion": config.dispersion,
+        "invertSpectrum": False,
+        "selectedFitting": None,
+        "checkedFittings": fittings,
+        "baselineCorrection": True,
+        "normalizeData": False,
+        "calibration": config.calibration,
+    }
+    setting.update(kwargs)
+    return BasicSetting(**setting)
@@ -6,23 +6,225 @@ Created on Tue Feb  2 14:02:43 2021
 @author: hauke
 """
 
+# standard libs
+import os
+import multiprocessing
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# third-party libs
+import numpy as np
+
+# local modules/libs
 import modules.universal as uni
 
-from .spectrumhandler import SpectrumHandler
-from ..filehandling.filereading.filereader import FileReader
+from . import resultcache
+from .spectrumhandler import SpectrumHandler, estimate_baselines
+from ..filehandling.filereading.filereader import FileReader, is_kinetic_series, read_frames
+from loader.configloader import ConfigLoader, init_worker
 from c_types.basicsetting import BasicSetting
 
 # Enums
 from c_enum.characteristic import CHARACTERISTIC as CHC
 
+# exceptions
+from exception.InvalidSpectrumError import InvalidSpectrumError
+
+# constants
+# Number of jobs per process which are submitted to the pool in advance.
+PENDING_JOBS_PER_PROCESS = 4
+# Number of files analysed in one job. The baselines of spectra with the same length are estimated at once.
+FILES_PER_JOB = 32
+
+
+def analyze_files(files:list, setting:BasicSetting, processes:int=1):
+    """
+    Analyzes the files and yields (filename, result) in the order of the given files.
+
+    result is the return value of analyze_filename. Uses a pool of processes if processes is
+    not 1 (None or 0: all available cores). Closing the generator cancels all pending jobs.
+    """
+    files = list(files)
+    jobs = [files[idx:idx+FILES_PER_JOB] for idx in range(0, len(files), FILES_PER_JOB)]
+
+    if processes == 1:
+        for filenames in jobs:
+            yield from analyze_filenames(filenames, setting)
+        return
+
+    processes = processes or os.cpu_count()
+    # Spawn instead of fork: A forked Qt application is not safe to use.
+    context = multiprocessing.get_context("spawn")
+    maxPendingJobs = processes * PENDING_JOBS_PER_PROCESS
+    # The workers load the configuration of this process, not the default one.
+    configPath = os.path.abspath(ConfigLoader().path)
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context,
+                             initializer=init_worker, initargs=(configPath,)) as pool:
+        pending = deque()
+        try:
+            for filenames in jobs:
+                pending.append(pool.submit(analyze_filenames, filenames, setting))
+                if len(pending) >= maxPendingJobs:
+                    yield from pop_results(pending)
+            while pending:
+                yield from pop_results(pending)
+        finally:
+            for job in pending:
+                job.cancel()
+
+
+def pop_results(pending:deque)->list:
+    """Waits for the oldest job and returns its list of (filename, result)."""
+    job = pending.popleft()
+    return job.result()
+
+
+def analyze_filenames(filenames:list, setting:BasicSetting)->list:
+    """
+    Reads and analyzes the files. Results are taken from the result cache (if enabled).
+
+    Runs also in worker processes, therefore the result contains only picklable data.
+
+    Returns
+    -------
+    List of (filename, result) in the order of filenames, result as of analyze_filename.
+
+    """
+    fingerprint = resultcache.setting_fingerprint(setting) if resultcache.is_enabled() else None
+    results = {}
+    if fingerprint is not None:
+        for filename in filenames:
+            isCached, result = resultcache.load(filename, fingerprint)
+            if isCached:
+                results[filename] = result
+
+    pendingFiles = [filename for filename in filenames if filename not in results]
+    for filename, result in read_and_analyze(pendingFiles, setting):
+        results[filename] = result
+        if fingerprint is not None:
+            resultcache.store(filename, fingerprint, result)
+    return [(filename, results[filename]) for filename in filenames]
+
+
+def read_and_analyze(filenames:list, setting:BasicSetting)->list:
+    """
+    Reads and analyzes the files.
+
+    The baselines of spectra with the same length are estimated at once. Kinetic series are
+    analyzed frame by frame (see analyze_kinetic_series).
+
+    Returns
+    -------
+    List of (filename, result) in the order of filenames, result as of analyze_filename.
+
+    """
+    isKinetic = [is_kinetic_series(filename) for filename in filenames]
+    files = [None if kinetic else read_file(filename) for filename, kinetic in zip(filenames, isKinetic)]
+    spectraResults = analyze_spectra(files, setting)
+
+    results = []
+    for filename, kinetic, result in zip(filenames, isKinetic, spectraResults):
+        if kinetic:
+            result = analyze_kinetic_series(filename, setting)
+        results.append((filename, result))
+    return results
+
+
+def analyze_spectra(files:list, setting:BasicSetting)->list:
+    """Analyzes the read files (None is skipped). Returns the result of each file as of analyze_spectrum."""
+    baselines = estimate_baselines_of_files(files, setting)
+    return [analyze_spectrum(file, setting, baseline) for file, baseline in zip(files, baselines)]
+
+
+def analyze_kinetic_series(filename:str, setting:BasicSetting)->tuple:
+    """
+    Analyzes each frame of a kinetic series as spectrum of its own.
+
+    The frames are read and analyzed in blocks of FILES_PER_JOB, only one block is kept in
+    memory. The rows of each frame contain the label and the time of the frame.
+
+    Returns
+    -------
+    (data, header) of all frames as of analyze_file or None if all frames are skipped.
+
+    """
+    data = []
+    header = None
+    frames = read_frames(filename)
+    while True:
+        block = list(islice(frames, FILES_PER_JOB))
+        if not block:
+            break
+        for result in analyze_spectra(block, setting):
+            if result is None:
+                continue
+            frameData, header = result
+            data.extend(frameData)
+
+    if header is None:
+        return None
+    return data, header
+
+
+def analyze_filename(filename:str, setting:BasicSetting)->tuple:
+    """
+    Reads and analyzes the file.
+
+    Returns
+    -------
+    (data, header) as of analyze_file or None if the file is skipped.
+
+    """
+    return analyze_spectrum(read_file(filename), setting)
+
+
+def read_file(filename:str)->FileReader:
+    """Reads the file. Returns None if the file cannot be analyzed."""
+    try:
+        file = FileReader(filename)
+    except FileNotFoundError:
+        return None
+
+    if not file.is_analyzable():
+        return None
+    return file
+
+
+def estimate_baselines_of_files(files:list, setting:BasicSetting)->list:
+    """Estimates the baselines of spectra with the same length at once. Other entries are None."""
+    baselines = [None] * len(files)
+
+    spectraBySize = defaultdict(list)
+    for idx, file in enumerate(files):
+        if file is not None and file.is_valid_spectrum():
+            spectraBySize[len(file.data)].append(idx)
+
+    for indices in spectraBySize.values():
+        rawYData = np.array([files[idx].data[:, 1] for idx in indices], dtype=float)
+        for idx, baseline in zip(indices, estimate_baselines(rawYData, setting.invertSpectrum)):
+            baselines[idx] = baseline
+    return baselines
+
+
+def analyze_spectrum(file:FileReader, setting:BasicSetting, baseline:np.ndarray=None)->tuple:
+    """Returns (data, header) as of analyze_file or None if the file is skipped."""
+    if file is None:
+        return None
+
+    try:
+        specHandler = SpectrumHandler(file, setting, useFileWavelength=True, baseline=baseline)
+    except InvalidSpectrumError:
+        return None
+
+    return analyze_file(setting, specHandler, file)
+
 
 def analyze_file(setting:BasicSetting, specHandler:SpectrumHandler, file:FileReader)->tuple:
     data = []
     header = []
     results = {}
-    for fitting in setting.checkedFittings:
-        specHandler._process_data()
-        specHandler.fit_data(fitting)
+    for _ in specHandler.fit_multiple(setting.checkedFittings):
         results = merge_characteristics(specHandler, file)
 
         # excluding file if no appropiate data given like in processed spectra.
@@ -49,5 +251,5 @@ def assemble_header(data:dict)->list:
 
 
 def assemble_row(data:dict)->list:
-    row = data.values()
+    row = list(data.values())
     return row
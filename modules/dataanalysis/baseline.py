@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Baseline estimation with cached pseudo-inverse.
+
+Implements the iterative polynomial fit of peakutils.baseline. Spectra of one detector have the
+same length, therefore the Vandermonde matrix and its pseudo-inverse are computed once per
+(size, degree) and kept in a bounded LRU cache. Each iteration consists of matrix products
+only, spectra of the same length can be fitted at once (baseline_stack).
+
+peakutils scales the abscissa with the intensity of the spectrum (to avoid numerical issues).
+The scaling only rescales the coefficients: vander(c*u) = vander(u) @ diag(c**powers). It is
+therefore applied to the coefficients instead of the matrix and does not interfere with the cache.
+
+Usage:
+    from modules.dataanalysis.baseline import baseline
+    base = baseline(yData)
+    bases = baseline_stack(yStack)
+
+Created on Sat Oct 17 14:02:10 2026
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+from functools import lru_cache
+
+# third-party libs
+import numpy as np
+
+# local modules/libs
+
+# constants
+DEFAULT_DEGREE = 3
+DEFAULT_MAX_ITERATIONS = 100
+DEFAULT_TOLERANCE = 1e-3
+CACHE_SIZE = 16
+
+
+def baseline(yData:np.ndarray, deg:int=DEFAULT_DEGREE, max_it:int=DEFAULT_MAX_ITERATIONS,
+             tol:float=DEFAULT_TOLERANCE)->np.ndarray:
+    """
+    Computes the baseline of the given data (see peakutils.baseline for details).
+
+    Iteratively performs a polynomial fitting in the data to detect its baseline. At every
+    iteration, the fitting weights on the regions with peaks are reduced to identify the
+    baseline only.
+    """
+    return baseline_stack(yData[np.newaxis, :], deg, max_it, tol)[0]
+
+
+def baseline_stack(yData:np.ndarray, deg:int=DEFAULT_DEGREE, max_it:int=DEFAULT_MAX_ITERATIONS,
+                   tol:float=DEFAULT_TOLERANCE)->np.ndarray:
+    """
+    Computes the baseline of each row of the given data (2-D: spectra x pixels).
+
+    All rows are fitted at once, each row is iterated until its own coefficients converged.
+    The result of each row equals the result of baseline.
+    """
+    order = deg + 1
+    noSpectra, size = yData.shape
+    bases = np.array(yData, dtype=float)
+
+    scaling = np.power(abs(yData).max(axis=1, initial=0.0), 1. / order)
+    # All data of a row are 0.
+    isZero = (scaling == 0)
+    bases[isZero] = 0.0
+    active = np.flatnonzero(~isZero)
+    if not active.size:
+        return bases
+
+    vander, vanderPinv = vandermonde(size, deg)
+    # The convergence is tested on the coefficients of the scaled abscissa as in peakutils.
+    coeffScaling = np.power(scaling[:, np.newaxis], np.arange(deg, -1, -1))
+
+    coeffs = np.ones((noSpectra, order))
+    yData = bases[active]
+    for _ in range(max_it):
+        unscaledCoeffs = yData @ vanderPinv.T
+        newCoeffs = unscaledCoeffs / coeffScaling[active]
+
+        difference = np.linalg.norm(newCoeffs - coeffs[active], axis=1)
+        isConverged = (difference / np.linalg.norm(coeffs[active], axis=1) < tol)
+
+        # Only the rows, which are not converged yet, are iterated further.
+        proceed = ~isConverged
+        active, yData = active[proceed], yData[proceed]
+        if not active.size:
+            break
+
+        coeffs[active] = newCoeffs[proceed]
+        bases[active] = unscaledCoeffs[proceed] @ vander.T
+        yData = np.minimum(yData, bases[active])
+
+    return bases
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def vandermonde(size:int, deg:int)->tuple:
+    """Vandermonde matrix of the abscissa [0, 1] with size points and its pseudo-inverse (read-only)."""
+    abscissa = np.linspace(0., 1., size)
+    vander = np.vander(abscissa, deg + 1)
+    vanderPinv = np.linalg.pinv(vander)
+    vander.flags.writeable = False
+    vanderPinv.flags.writeable = False
+    return vander, vanderPinv
@@ -8,16 +8,22 @@ Created on Fri Dec 11 16:48:57 2020
 
 # standard libs
 import logging
+import os
+from functools import lru_cache
+
 import numpy as np
 
 # third-party libs
 
 # local modules/libs
+from .peakintegration import closest_indices
 from exception.CalibrationError import CalibrationError
 
 # constants
 NO_ITERATION = 3
 MAX_SHIFT_nm = 0.3
+# Number of calibration files (or versions of them) kept in memory.
+CACHE_SIZE = 16
 
 
 
@@ -32,15 +38,20 @@ class Calibration():
         self._logger = logging.getLogger(self.__class__.__name__)
 
         self._shift = 0.0
+        self._peakIndices = None
 
-        self.calibrationPeaks = np.loadtxt(calibrationFile, usecols=0, dtype=float, ndmin=1)
+        self.calibrationPeaks = load_calibration_peaks(calibrationFile)
         self.noPeaks = self.calibrationPeaks.size
 
 
     ### Methods
     def calibrate(self, xData:np.ndarray, yData:np.ndarray)->np.ndarray:
         for _ in range(NO_ITERATION):
+            previousIndices = self._peakIndices
             xData = self.calibrate_data(xData, yData)
+            # Converged: The same data points are assigned to the calibration peaks, further shifts are only rounding errors.
+            if np.array_equal(self._peakIndices, previousIndices):
+                break
         return xData, self._shift
 
 
@@ -51,17 +62,15 @@ class Calibration():
         if any(wlIndex + maxShift > xData.size) or any(wlIndex - maxShift < 0) or maxShift == 0:
             raise CalibrationError("Calibration peaks out of spectral range!")
 
-        calibrationIntensities = np.zeros(shape=(self.noPeaks, 2*maxShift+1))
-        for idx in range(-maxShift, maxShift+1):
-            for ref in range(self.noPeaks):
-                intensity = yData[wlIndex[ref] + idx]
-                idxOffset = idx + maxShift
-                calibrationIntensities[ref, idxOffset] = intensity
+        # Intensities of each calibration peak (rows) for each shift (columns).
+        shifts = np.arange(-maxShift, maxShift+1)
+        calibrationIntensities = yData[wlIndex[:, np.newaxis] + shifts]
 
         summedIntensities = calibrationIntensities.sum(axis=0)
 
         shift = summedIntensities.argmax() - maxShift
-        absShift = (self.calibrationPeaks - xData[wlIndex+shift]).mean()
+        self._peakIndices = wlIndex + shift
+        absShift = (self.calibrationPeaks - xData[self._peakIndices]).mean()
         self._shift += absShift
 
         shiftedData = xData + absShift
@@ -69,17 +78,27 @@ class Calibration():
 
 
     def find_indeces_and_max_shift(self, xData:np.ndarray)->np.ndarray:
-        wlIndex = np.zeros((self.noPeaks), dtype=int)
-        maxShift = 0
-        for i, wl in enumerate(self.calibrationPeaks):
-            wlIndex[i] = self.find_index_with_closest_value(xData, wl)
-            # determine the range of the convolution
-            idxShift = self.find_index_with_closest_value(xData, (wl + MAX_SHIFT_nm))
-            maxShift = max(idxShift-wlIndex[i], maxShift)
+        wlIndex = closest_indices(xData, self.calibrationPeaks)
+        # determine the range of the convolution
+        idxShift = closest_indices(xData, self.calibrationPeaks + MAX_SHIFT_nm)
+        maxShift = max((idxShift - wlIndex).max(), 0)
         return wlIndex, maxShift
 
 
-    @staticmethod
-    def find_index_with_closest_value(arr:np.ndarray, value:float)->int:
-        index = np.abs(arr - value).argmin()
-        return index
+def load_calibration_peaks(calibrationFile:str)->np.ndarray:
+    """
+    Loads the wavelengths of the calibration peaks.
+
+    The peaks are cached, the file is read again if it was modified. The returned array is
+    shared and therefore read-only.
+    """
+    modificationTime = os.stat(calibrationFile).st_mtime_ns
+    return _load_calibration_peaks(os.path.abspath(calibrationFile), modificationTime)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _load_calibration_peaks(calibrationFile:str, modificationTime:int)->np.ndarray:
+    # The modification time is only part of the key of the cache.
+    calibrationPeaks = np.loadtxt(calibrationFile, usecols=0, dtype=float, ndmin=1)
+    calibrationPeaks.flags.writeable = False
+    return calibrationPeaks
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Integration of several peaks of a spectrum at once.
+
+The integration windows are located by binary search on the (monotonic) wavelength axis and
+the areas are taken from the cumulative trapezoid sums. Therefore the spectrum is passed once
+regardless of the number of peaks: O(n + k log n) for k windows.
+
+Usage:
+    from modules.dataanalysis.peakintegration import integrate_windows
+    starts, stops, areas, heights, positions = integrate_windows(xData, yData, lowerLimits, upperLimits)
+
+Created on Sat Oct 17 10:21:44 2026
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+import numpy as np
+
+# third-party libs
+
+# local modules/libs
+
+
+
+def integrate_windows(xData:np.ndarray, yData:np.ndarray, lowerLimits, upperLimits)->tuple:
+    """
+    Integrates the spectrum within each window [lowerLimit, upperLimit].
+
+    The limits are mapped onto the closest data point. A window is empty if it is below or above
+    the spectrum, the characteristics of an empty window are 0.0.
+
+    Returns
+    -------
+    (starts, stops, areas, heights, positions)
+        starts and stops define the integration range of each window: range(start, stop).
+        areas are determined by the composite trapezoidal rule, heights and positions
+        are taken from the highest data point within the window.
+
+    """
+    lowerLimits = np.asarray(lowerLimits, dtype=float)
+    upperLimits = np.asarray(upperLimits, dtype=float)
+
+    idxBorderLeft = closest_indices(xData, lowerLimits)
+    idxBorderRight = closest_indices(xData, upperLimits)
+
+    isBelowSpectrum = (idxBorderRight == 0)
+    isAboveSpectrum = (idxBorderLeft >= idxBorderRight)
+    isEmpty = isBelowSpectrum | isAboveSpectrum
+
+    starts = np.where(isEmpty, 0, idxBorderLeft)
+    stops = np.where(isEmpty, 0, idxBorderRight + 1)
+
+    areas = integrate_ranges(xData, yData, starts, stops)
+    idxPeaks = argmax_ranges(yData, starts, stops)
+    heights = np.where(isEmpty, 0.0, yData[idxPeaks])
+    positions = np.where(isEmpty, 0.0, xData[idxPeaks])
+    return starts, stops, areas, heights, positions
+
+
+def closest_indices(xData:np.ndarray, values:np.ndarray)->np.ndarray:
+    """
+    Determines the index of the closest data point for each value.
+
+    Equivalent to np.abs(xData - value).argmin() (the lower index on ties), but uses a binary
+    search if the data are strictly increasing.
+    """
+    if not is_strictly_increasing(xData) or not np.isfinite(values).all():
+        return np.array([np.abs(xData - value).argmin() for value in values], dtype=int)
+
+    idxRight = np.searchsorted(xData, values).clip(1, xData.size - 1)
+    idxLeft = idxRight - 1
+    isLeftCloser = (values - xData[idxLeft]) <= (xData[idxRight] - values)
+    return np.where(isLeftCloser, idxLeft, idxRight)
+
+
+def is_strictly_increasing(data:np.ndarray)->bool:
+    # Comparisons with nan are False, therefore data with nan are not increasing.
+    return data.size > 1 and bool((data[1:] > data[:-1]).all())
+
+
+def integrate_ranges(xData:np.ndarray, yData:np.ndarray, starts:np.ndarray, stops:np.ndarray)->np.ndarray:
+    """Integrates yData along xData in range(start, stop) for each start/stop. Empty ranges yield 0.0."""
+    segments = np.diff(xData) * (yData[1:] + yData[:-1]) / 2.0
+    cumulativeArea = np.concatenate(([0.0], np.cumsum(segments)))
+
+    isEmpty = (stops - starts < 2)
+    lastIndices = np.where(isEmpty, starts, stops - 1)
+    return cumulativeArea[lastIndices] - cumulativeArea[starts]
+
+
+def argmax_ranges(yData:np.ndarray, starts:np.ndarray, stops:np.ndarray)->np.ndarray:
+    """Index of the maximum in range(start, stop) for each start/stop. Empty ranges yield the start."""
+    widths = stops - starts
+    maxWidth = widths.max(initial=0)
+    if not maxWidth:
+        return starts
+
+    offsets = np.arange(maxWidth)
+    indices = (starts[:, np.newaxis] + offsets).clip(max=yData.size - 1)
+    isInRange = offsets < widths[:, np.newaxis]
+    windows = np.where(isInRange, yData[indices], -np.inf)
+    return starts + windows.argmax(axis=1)
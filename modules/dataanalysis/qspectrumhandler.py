@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Qt adapter of the SpectrumHandler.
+
+The SpectrumHandler is free of Qt. This adapter analyses a spectrum for the ui and
+notifies the ui about the properties of the spectrum.
+
+Usage:
+    from modules.dataanalysis.qspectrumhandler import QSpectrumHandler
+    adapter = QSpectrumHandler()
+    adapter.pixelDataTriggered.connect(slot)
+    specHandler = adapter.analyze(file, setting)
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+
+# third-party libs
+from PyQt5.QtCore import QObject, pyqtSignal
+
+# local modules/libs
+from .spectrumhandler import SpectrumHandler
+from ..filehandling.filereading.filereader import FileReader
+from c_types.basicsetting import BasicSetting
+
+
+class QSpectrumHandler(QObject):
+
+    ### Signals
+    pixelDataTriggered = pyqtSignal(bool)
+
+
+    ### Methods
+
+    def analyze(self, file:FileReader, basicSetting:BasicSetting, **kwargs)->SpectrumHandler:
+        """
+        Sets up a SpectrumHandler and emits the signals.
+
+        Raises InvalidSpectrumError as the SpectrumHandler does.
+        """
+        specHandler = SpectrumHandler(file, basicSetting, **kwargs)
+        self.pixelDataTriggered.emit(specHandler.xDataArePixel)
+        return specHandler
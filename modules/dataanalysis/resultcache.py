@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache of the analysis results on the disk (opt-in).
+
+Entries are keyed by the path, size and modification time of the file and a fingerprint of
+the analysis. The fingerprint covers the setting, the parameters of the fittings and the
+content of their calibration files. Therefore, modified files, fittings or calibration files
+miss the cache. Cached are:
+    - the result of a file in the batch analysis (rows and header as exported into a batchfile,
+      or None if the file is skipped),
+    - the baseline of a spectrum and the results of a fit (characteristic values, calibrated x
+      data and integration ranges) in the interactive analysis.
+
+The cache is enabled by the directory in the configuration:
+
+    GENERAL:
+      RESULT_CACHE_DIR: ./.cache/results
+      RESULT_CACHE_SIZE_MB: 200
+
+Usage:
+    from modules.dataanalysis import resultcache
+    fingerprint = resultcache.setting_fingerprint(setting)
+    isCached, result = resultcache.load(filename, fingerprint)
+    resultcache.store(filename, fingerprint, result)
+    # Interactive analysis.
+    baseline = resultcache.load_baseline(filename, invertSpectrum)  # None if not cached
+    resultcache.fit_data(specHandler, filename, fitting)
+    resultcache.clear()
+
+Created on Sun Oct 18 09:20:12 2026
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+import hashlib
+import json
+import os
+from functools import lru_cache
+
+# third-party libs
+import numpy as np
+
+# local modules/libs
+from loader.configloader import ConfigLoader
+from ..filehandling.diskcache import DiskCache
+
+# types
+from c_types.basicsetting import BasicSetting
+
+# constants
+# Increase if the analysis returns different results. Invalidates all entries.
+CACHE_VERSION = 1
+MEGABYTE = 2**20
+
+
+@lru_cache(maxsize=1)
+def get_cache()->DiskCache:
+    """The result cache as configured, None if disabled."""
+    config = ConfigLoader()
+    directory = config.resultCacheDir
+    if not directory:
+        return None
+    return DiskCache(directory, config.resultCacheSize * MEGABYTE)
+
+
+def is_enabled()->bool:
+    return get_cache() is not None
+
+
+def load(filename:str, fingerprint:str)->tuple:
+    """(True, result) if the result of the file is cached, (False, None) otherwise."""
+    cache = get_cache()
+    if cache is None:
+        return False, None
+
+    try:
+        key = cache_key(filename, fingerprint)
+    except OSError:
+        return False, None
+    entry = cache.get(key)
+    if entry is None:
+        return False, None
+    return True, entry["result"]
+
+
+def store(filename:str, fingerprint:str, result:tuple)->None:
+    cache = get_cache()
+    if cache is None:
+        return
+
+    try:
+        key = cache_key(filename, fingerprint)
+    except OSError:
+        return
+    # Wrapped: A skipped file (None) is cached as well.
+    cache.set(key, {"result": result})
+
+
+def load_baseline(filename:str, invertSpectrum:bool)->np.ndarray:
+    """The cached baseline of the spectrum, None if not cached."""
+    _, baseline = load(filename, baseline_fingerprint(invertSpectrum))
+    return baseline
+
+
+def store_baseline(filename:str, invertSpectrum:bool, baseline:np.ndarray)->None:
+    store(filename, baseline_fingerprint(invertSpectrum), baseline)
+
+
+def fit_data(specHandler, filename:str, fitting)->None:
+    """
+    Fits the spectrum as SpectrumHandler.fit_data does. The results are restored from the
+    cache if the spectrum was fitted with the same fitting and setting before.
+    """
+    if not is_enabled() or fitting is None or fitting.peak is None:
+        specHandler.fit_data(fitting)
+        return
+
+    fingerprint = fit_fingerprint(specHandler.basicSetting, fitting)
+    isCached, state = load(filename, fingerprint)
+    if isCached:
+        specHandler.set_fit_state(fitting, state)
+        return
+
+    specHandler.fit_data(fitting)
+    store(filename, fingerprint, specHandler.get_fit_state())
+
+
+def invalidate(filename:str, setting:BasicSetting)->None:
+    """Removes the result of the file analyzed with the setting."""
+    cache = get_cache()
+    if cache is None:
+        return
+
+    try:
+        key = cache_key(filename, setting_fingerprint(setting))
+    except OSError:
+        return
+    cache.delete(key)
+
+
+def clear()->None:
+    """Removes all results."""
+    cache = get_cache()
+    if cache is not None:
+        cache.clear()
+
+
+def cache_key(filename:str, fingerprint:str)->tuple:
+    # The filename as given is part of the result (rows).
+    stat = os.stat(filename)
+    return (CACHE_VERSION, filename, os.path.abspath(filename), stat.st_size, stat.st_mtime_ns, fingerprint)
+
+
+def setting_fingerprint(setting:BasicSetting)->str:
+    """Identifies the setting including the parameters and calibration files of the fittings."""
+    identity = [[fitting_identity(fitting) for fitting in setting.checkedFittings]]
+    identity.extend(processing_identity(setting))
+    return fingerprint_of(identity)
+
+
+def fit_fingerprint(setting:BasicSetting, fitting)->str:
+    """Identifies the fit of a spectrum with the fitting."""
+    return fingerprint_of(["fit", fitting_identity(fitting)] + processing_identity(setting))
+
+
+def baseline_fingerprint(invertSpectrum:bool)->str:
+    return fingerprint_of(["baseline", invertSpectrum])
+
+
+def processing_identity(setting:BasicSetting)->list:
+    """The fields of the setting which determine the processing of a spectrum."""
+    return [
+        setting.wavelength,
+        setting.dispersion,
+        setting.invertSpectrum,
+        setting.baselineCorrection,
+        setting.normalizeData,
+        setting.calibration,
+    ]
+
+
+def fingerprint_of(identity:list)->str:
+    return hashlib.sha1(json.dumps(identity, default=str).encode("utf-8")).hexdigest()
+
+
+def fitting_identity(fitting)->list:
+    """The parameters of the fitting (incl. reference and normalization)."""
+    peak = fitting.peak
+    peakParameter = {} if peak is None else vars(peak)
+    peakParameter = {key: repr(value) for key, value in peakParameter.items() if not key.startswith("_")}
+    return [fitting.filename, fitting.name, fitting.calibration, sorted(peakParameter.items()),
+            file_hash(fitting.calibration)]
+
+
+def file_hash(filename:str)->str:
+    """Hash of the content of the file. None if not accessible."""
+    if not filename:
+        return None
+    try:
+        with open(filename, "rb") as file:
+            return hashlib.sha1(file.read()).hexdigest()
+    except OSError:
+        return None
@@ -17,16 +17,16 @@ Glossary:
 # standard libs
 import logging
 import numpy as np
+from dataclasses import replace
 
 # third-party libs
-from PyQt5.QtCore import pyqtSignal
-from PyQt5.QtWidgets import QDialog
-import peakutils as pkus
 
 # local modules/libs
 import modules.universal as uni
+import modules.dataanalysis.baseline as bl
 from .calibration import Calibration
 from .fitting import Fitting
+from .peakintegration import integrate_windows
 from ..filehandling.filereading.filereader import FileReader
 from c_types.basicsetting import BasicSetting
 
@@ -42,21 +42,32 @@ from exception.CalibrationError import CalibrationError
 from exception.InvalidSpectrumError import InvalidSpectrumError
 from exception.ParameterNotSetError import ParameterNotSetError
 
+# constants
+# Attributes describing the results of a fit (see get_fit_state).
+FIT_ATTRIBUTES = ("_peakArea", "_peakHeight", "_peakName", "peakPosition", "_refArea", "_refHeight",
+                  "refPosition", "_characteristicValue", "_calibrationShift", "_calibrationPeaks",
+                  "_fitting_file")
 
-class SpectrumHandler(QDialog):
+
+class SpectrumHandler():
     """Handles and analyses spectra.
 
-    SpectrumHandler(basicSetting, **kwargs):
+    Pure computation without any ui dependency, therefore it can be pickled and used in
+    worker processes. The ui is notified by the QSpectrumHandler.
+
+    SpectrumHandler(file, basicSetting, **kwargs):
     Parameters:
     -----------
+        file:
+            The spectrum to analyse.
         basicSetting:
             The selected setting. Includes information regarding the analysis.
         **kwargs:
-            parameter:
-                Information about wavelength, dispersion,...
+            useFileWavelength:
+                Uses the wavelength of the file (if provided) instead of the one of the setting.
+            baseline:
+                Precomputed baseline of the raw data (see estimate_baselines).
      """
-    ### Signals
-    pixelDataTriggered = pyqtSignal(bool)
 
     ### Properties
 
@@ -119,32 +130,34 @@ class SpectrumHandler(QDialog):
 
     ### __methods__
 
-    def __init__(self, file:FileReader, basicSetting:BasicSetting, slotPixel=None, useFileWavelength:bool=False):
-        super().__init__()
+    def __init__(self, file:FileReader, basicSetting:BasicSetting, useFileWavelength:bool=False,
+                 baseline:np.ndarray=None):
         self._logger = logging.getLogger(self.__class__.__name__)
 
         if not file.is_valid_spectrum():
             raise InvalidSpectrumError("File contains no valid spectrum.")
 
         if useFileWavelength:
+            # Replace instead of overwrite the wavelength. Otherwise the wavelength leaks into the
+            # analysis of subsequent files without a wavelength (and the result depends on the order).
             try:
-                basicSetting.wavelength = file.WAVELENGTH
+                basicSetting = replace(basicSetting, wavelength=file.WAVELENGTH)
             except ParameterNotSetError:
                 pass
 
         self.basicSetting = basicSetting
 
         self.integration = []
+        self._integrationRanges = []
         self.fitting = None
+        self._fitting_file = None
         self._avgbase = None
+        self.xDataArePixel = False
 
         self._reset_values()
 
-        if not slotPixel is None:
-            self.pixelDataTriggered.connect(slotPixel)
-
         self.rawData = file.data
-        self._process_data()
+        self._process_data(baseline)
 
 
     def __repr__(self):
@@ -171,8 +184,14 @@ class SpectrumHandler(QDialog):
 
 
     def fit_data(self, fitting:Fitting)->ERR:
-        # Find Peak and obtain height, area, and position
+        """
+        Find Peak and obtain height, area, and position.
+
+        The processed data are shared by all fittings, only the calibration is reverted. Therefore
+        the spectrum can be fitted subsequently with several fittings without being processed again.
+        """
         self.fitting = fitting
+        self._revert_calibration()
 
         # In case no fitting is selected, the spectrum cannot be displayed.
         try:
@@ -185,9 +204,6 @@ class SpectrumHandler(QDialog):
 
         self._reset_values()
 
-        peak = fitting.peak
-        self._peakName = peak.name
-
         calibrationFile = self.fitting.calibration
         if self.basicSetting.calibration and calibrationFile:
             calibration = Calibration(calibrationFile)
@@ -198,45 +214,111 @@ class SpectrumHandler(QDialog):
                 # TODO: Handle Calibration Error here! See #172
                 print(f"Spectrumhandler, line 193 (TODO): {e}")
 
-        peakCharacteristics, integrationAreas = self._analyse_peak(peak)
+        peaks = get_peaks(fitting)
+        characteristics, integrationRanges = self._analyse_peaks(peaks)
+        self._assign_characteristics(fitting.peak, characteristics)
+        self._set_integration(integrationRanges)
+        return ERR.OK
+
+
+    def get_fit_state(self)->dict:
+        """The results of the last fit (incl. calibrated x data and integration ranges), e.g. to cache them."""
+        return {
+            "values": {name: getattr(self, name) for name in FIT_ATTRIBUTES},
+            "procXData": self.procXData,
+            "integrationRanges": self._integrationRanges,
+        }
+
+
+    def set_fit_state(self, fitting:Fitting, state:dict)->None:
+        """Restores the results of a fit of the same spectrum and setting (see get_fit_state)."""
+        self.fitting = fitting
+        for name, value in state["values"].items():
+            setattr(self, name, value)
+        self.procXData = state["procXData"]
+        self._set_integration(state["integrationRanges"])
+
+
+    def _set_integration(self, integrationRanges:list)->None:
+        """Integration areas of the peak and the reference peak (if any)."""
+        self._integrationRanges = integrationRanges
+        self.integration = self._get_integration_areas(integrationRanges[0])
+        if len(integrationRanges) > 1:
+            refIntegrationAreas = self._get_integration_areas(integrationRanges[1])
+            self.integration.extend(set_type_to_reference(refIntegrationAreas))
+
+
+    def fit_multiple(self, fittings:list):
+        """
+        Fits the spectrum with each fitting and yields the fitting as soon as the results are available.
+
+        The peaks of all fittings without calibration are analysed at once. Integration areas are not
+        determined.
+
+        Usage:
+            for fitting in specHandler.fit_multiple(fittings):
+                results = specHandler.results
+        """
+        self._revert_calibration()
+        batchFittings = [fitting for fitting in fittings if self._is_batchable(fitting)]
+        peaksOfFittings = [get_peaks(fitting) for fitting in batchFittings]
+        peaks = [peak for fittingPeaks in peaksOfFittings for peak in fittingPeaks]
+        characteristics, _ = self._analyse_peaks(peaks)
+
+        batchCharacteristics = []
+        for fittingPeaks in peaksOfFittings:
+            batchCharacteristics.append(characteristics[:len(fittingPeaks)])
+            characteristics = characteristics[len(fittingPeaks):]
+        batchCharacteristics = iter(batchCharacteristics)
+
+        for fitting in fittings:
+            if not self._is_batchable(fitting):
+                self.fit_data(fitting)
+                yield fitting
+                continue
+
+            self.fitting = fitting
+            self._revert_calibration()
+            self._fitting_file = fitting.filename
+            self._reset_values()
+            self._assign_characteristics(fitting.peak, next(batchCharacteristics))
+            self.integration = []
+            self._integrationRanges = []
+            yield fitting
+
+
+    def _is_batchable(self, fitting:Fitting)->bool:
+        # A calibration shifts the spectrum for that particular fitting.
+        try:
+            hasPeak = fitting.peak is not None
+        except AttributeError:
+            return False
+        return hasPeak and not (self.basicSetting.calibration and fitting.calibration)
+
+
+    def _assign_characteristics(self, peak:Peak, characteristics:list)->None:
+        peakCharacteristics = characteristics[0]
+        self._peakName = peak.name
         self._peakHeight = peakCharacteristics[CHC.PEAK_HEIGHT]
         self._peakArea = peakCharacteristics[CHC.PEAK_AREA]
         self.peakPosition = peakCharacteristics[CHC.PEAK_POSITION]
-        self.integration = list(integrationAreas.values())
 
-        try:
-            validReference = peak.has_valid_reference()
-        except ValueError:
-            validReference = False
-
-        if validReference:
+        if len(characteristics) > 1:
             # Reference
-            refCharacteristics, _ = self._analyse_peak(peak.reference)
+            refCharacteristics = characteristics[1]
             self._refHeight = refCharacteristics[CHC.PEAK_HEIGHT]
             self._refArea = refCharacteristics[CHC.PEAK_AREA]
             self.refPosition = refCharacteristics[CHC.PEAK_POSITION]
-
-            characteristicValue, intAreas = self._calculate_characteristic_value(peak)
-            self._characteristicValue = characteristicValue
-            self.integration.extend(intAreas)
-
-        return ERR.OK
+            self._characteristicValue = self._calculate_characteristic_value(peak, refCharacteristics)
 
 
-    def _calculate_characteristic_value(self, peak:Peak)->tuple:
-
+    def _calculate_characteristic_value(self, peak:Peak, refCharacteristic:dict)->float:
         # Default =None. No peak found: =0.0.
         characteristicValue = None
-        intAreas = []
 
-        refCharacteristic, refIntegrationAreas = self._analyse_peak(peak.reference)
         refHeight = refCharacteristic[CHC.PEAK_HEIGHT]
         refArea = refCharacteristic[CHC.PEAK_AREA]
 
-        # Set the type for these integration areas.
-        integrationAreas = set_type_to_reference(refIntegrationAreas)
-        intAreas = integrationAreas.values()
-
         # Validation
         highRefPeak = (refHeight >= peak.reference.minimumHeight)
         posPeakArea = (self._peakArea > 0)
@@ -247,77 +329,43 @@ class SpectrumHandler(QDialog):
         else:
             characteristicValue = 0.0
 
-        return characteristicValue, intAreas
+        return characteristicValue
 
 
-    def _analyse_peak(self, peak:Peak)->(dict, dict):
+    def _analyse_peaks(self, peaks:list)->(list, list):
         """
-
         Searching the given data for peaks and find the closest peak to the
-        wavelength (just closest, due to discrete values). Integrates the peak.
+        wavelength (just closest, due to discrete values). Integrates the peaks.
 
         Parameters
         ----------
-        peak : Peak
-            Defines the values for the analysis of the peak.
+        peaks : list of Peak
+            Defines the values for the analysis of each peak.
+
+        Returns
+        -------
+        (characteristics, integrationRanges) of each peak.
 
         """
-        integrationRange = self._get_integration_range(peak)
-        area, height, position = self._analyze_peak_characteristics(integrationRange)
+        lowerLimits = [peak.centralWavelength - peak.shiftDown for peak in peaks]
+        upperLimits = [peak.centralWavelength + peak.shiftUp for peak in peaks]
+        starts, stops, areas, heights, positions = integrate_windows(self.procXData, self.procYData,
+                                                                     lowerLimits, upperLimits)
 
-        characteristics = {CHC.PEAK_POSITION: position,
-                           CHC.PEAK_HEIGHT: height,
-                           CHC.PEAK_AREA: area,}
+        characteristics = []
+        for area, height, position in zip(areas, heights, positions):
+            characteristics.append({CHC.PEAK_POSITION: position,
+                                    CHC.PEAK_HEIGHT: height,
+                                    CHC.PEAK_AREA: area,})
+        integrationRanges = [range(start, stop) for start, stop in zip(starts, stops)]
+        return characteristics, integrationRanges
 
-        # Determine integration areas.
+
+    def _get_integration_areas(self, integrationRange:range)->list:
         integrationRaw = Integration(self.rawData[integrationRange])
         integrationProcessed = Integration(self.procData[integrationRange],
                                            spectrumType=EXPORT_TYPE.PROCESSED)
-        integrationAreas = {CHC.INTEGRATION_RAW: integrationRaw,
-                            CHC.INTEGRATION_PROCESSED: integrationProcessed}
-
-        return characteristics, integrationAreas
-
-
-    def _get_integration_range(self, peak:Peak)->range:
-        lowerLimit = peak.centralWavelength - peak.shiftDown
-        upperLimit = peak.centralWavelength + peak.shiftUp
-
-        xData = self.procXData
-        idxBorderRight = np.abs(xData - upperLimit).argmin()
-        idxBorderLeft = np.abs(xData - lowerLimit).argmin()
-
-        isBelowSpectrum = (idxBorderRight == 0)
-        isAboveSpectrum = (idxBorderLeft == idxBorderRight)
-        if isBelowSpectrum or isAboveSpectrum:
-            return range(0)
-
-        integrationRange = range(idxBorderLeft, idxBorderRight+1)
-        return integrationRange
-
-
-    def _analyze_peak_characteristics(self, integrationRange:range)->None:
-
-        procXData, procYData = self.procXData, self.procYData
-
-        # Get the highest Peak in the integration area.
-        try:
-            idxPeak = procYData[integrationRange].argmax() + integrationRange[0]
-        except ValueError:
-            peakArea = 0.0
-            peakHeight = 0.0
-            peakPosition = 0.0
-            return peakArea, peakHeight, peakPosition
-
-        peakPosition = procXData[idxPeak]
-        peakHeight = procYData[idxPeak]
-
-        # getting all wavelength(x) and the intensities(y).
-        peakAreaX = procXData[integrationRange]
-        peakAreaY = procYData[integrationRange]
-        # Integrate along the given axis using the composite trapezoidal rule.
-        peakArea = np.trapz(peakAreaY, peakAreaX)
-        return peakArea, peakHeight, peakPosition
+        return [integrationRaw, integrationProcessed]
 
 
     def get_integration_areas(self):
@@ -375,11 +423,18 @@ class SpectrumHandler(QDialog):
         return shiftedData
 
 
-    def _process_data(self)->None:
+    def _process_data(self, baseline:np.ndarray=None)->None:
         """Processes the raw data with regard to the given wavelength and the dispersion."""
         procXData = self._process_x_data()
-        procYData, self.baseline, self._avgbase = self._process_y_data()
+        procYData, self.baseline, self._avgbase = self._process_y_data(baseline)
         self.procData = (procXData, procYData)
+        # The calibration of a fitting modifies the x data (in place).
+        self._uncalibratedXData = self.procXData.copy()
+
+
+    def _revert_calibration(self)->None:
+        """Restores the x data of the processed data, which may be shifted by a previous calibration."""
+        self.procXData = self._uncalibratedXData
 
 
     def _process_x_data(self)->np.ndarray:
@@ -391,8 +446,8 @@ class SpectrumHandler(QDialog):
 
         centralWavelength = self.basicSetting.wavelength
         dispersion = self.basicSetting.dispersion
-        xDataArePixel = uni.data_are_pixel(rawXData)
-        self.pixelDataTriggered.emit(xDataArePixel)
+        xDataArePixel = bool(uni.data_are_pixel(rawXData))
+        self.xDataArePixel = xDataArePixel
         if xDataArePixel:
             try:
                 # Employs the dispersion to convert pixel to wavelength
@@ -413,15 +468,14 @@ class SpectrumHandler(QDialog):
         return shiftedData
 
 
-    def _process_y_data(self):
-        # Docs: https://peakutils.readthedocs.io/en/latest/reference.html
-        invert = -1 if self.basicSetting.invertSpectrum else 1
+    def _process_y_data(self, baseline:np.ndarray=None):
+        invertSpectrum = self.basicSetting.invertSpectrum
+        invert = -1 if invertSpectrum else 1
 
         rawYData = self.rawYData[::invert]
-        # Baseline correction without DC drift.
-        # HINT: Issue 121 -> to be reviewed
-        meanIntensity = np.mean(rawYData)
-        baseline = pkus.baseline(rawYData - meanIntensity) + meanIntensity
+        if baseline is None:
+            baseline = estimate_baselines(self.rawYData[np.newaxis, :], invertSpectrum)[0]
+        baseline = baseline[::invert]
         avgbase = np.mean(baseline)
 
         # Shifting y data and normalization to average baseline intensity.
@@ -438,8 +492,38 @@ class SpectrumHandler(QDialog):
         return processedYdata, baseline[::invert], avgbase
 
 
-def set_type_to_reference(intAreas:dict)->dict:
-    for intArea in intAreas.values():
+def estimate_baselines(rawYData:np.ndarray, invertSpectrum:bool)->np.ndarray:
+    """
+    Estimates the baseline of each spectrum (2-D: spectra x pixels) as used by the SpectrumHandler.
+
+    Spectra of the same length are processed at once, which is faster than one by one.
+    """
+    # Docs: https://peakutils.readthedocs.io/en/latest/reference.html (reimplemented in baseline)
+    invert = -1 if invertSpectrum else 1
+
+    yData = rawYData[:, ::invert]
+    # Baseline correction without DC drift.
+    # HINT: Issue 121 -> to be reviewed
+    meanIntensity = yData.mean(axis=1, keepdims=True)
+    baselines = bl.baseline_stack(yData - meanIntensity) + meanIntensity
+    return baselines[:, ::invert]
+
+
+def get_peaks(fitting:Fitting)->list:
+    """The peak of the fitting and its reference (if valid)."""
+    peak = fitting.peak
+    try:
+        validReference = peak.has_valid_reference()
+    except ValueError:
+        validReference = False
+
+    if validReference:
+        return [peak, peak.reference]
+    return [peak]
+
+
+def set_type_to_reference(intAreas:list)->list:
+    for intArea in intAreas:
         intArea.peakType = CHC.TYPE_REFERENCE
     return intAreas
 
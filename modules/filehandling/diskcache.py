@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Size-bounded cache of objects on the disk.
+
+Each entry is stored as pickle (binary, numpy arrays are stored as raw buffer) in a file
+named by the hash of its key. The least recently used entries are removed if the total size
+exceeds the limit: The modification time of a file is updated on each access.
+
+Entries are written to a temporary file first and renamed afterwards. Therefore several
+processes may share a cache directory, a reader sees either a complete entry or none.
+
+Usage:
+    from modules.filehandling.diskcache import DiskCache
+    cache = DiskCache(directory, maxSize=100 * 2**20)
+    cache.set(key, value)
+    value = cache.get(key)  # None if not cached
+
+Created on Sun Oct 18 13:40:18 2026
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+
+# third-party libs
+
+# local modules/libs
+
+# constants
+SUFFIX = ".pkl"
+# Entries are removed until the size is below this fraction of the limit.
+EVICTION_RATIO = 0.8
+
+
+class DiskCache():
+
+    ### __methods__
+
+    def __init__(self, directory:str, maxSize:int)->None:
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self.directory = directory
+        self.maxSize = maxSize
+        # Determined on the first write.
+        self._size = None
+        os.makedirs(directory, exist_ok=True)
+
+
+    ### Methods
+
+    def get(self, key):
+        """The cached value of the key or None."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as entry:
+                value = pickle.load(entry)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, pickle.PickleError):
+            self._logger.warning("Invalid cache entry: %s", path)
+            self._remove(path)
+            return None
+
+        self._touch(path)
+        return value
+
+
+    def set(self, key, value)->None:
+        """Stores the value. Entries of the least recently used keys are removed if required."""
+        try:
+            fd, tmpPath = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        except OSError:
+            self._logger.warning("Could not write into cache: %s", self.directory)
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as entry:
+                pickle.dump(value, entry, protocol=pickle.HIGHEST_PROTOCOL)
+            size = os.path.getsize(tmpPath)
+            path = self._path(key)
+            # The size of an overwritten entry is replaced.
+            if self._size is not None and os.path.exists(path):
+                size -= os.path.getsize(path)
+            os.replace(tmpPath, path)
+        except OSError:
+            self._logger.warning("Could not write into cache: %s", self.directory)
+            self._remove(tmpPath)
+            return
+
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += size
+
+        if self._size > self.maxSize:
+            self.evict()
+
+
+    def delete(self, key)->None:
+        """Removes the entry of the key (if any)."""
+        path = self._path(key)
+        if self._size is not None and os.path.exists(path):
+            self._size -= os.path.getsize(path)
+        self._remove(path)
+
+
+    def size(self)->int:
+        return sum(stat.st_size for _, stat in self._entries())
+
+
+    def evict(self)->None:
+        """Removes the least recently used entries until the size is below the limit."""
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime_ns)
+        size = sum(stat.st_size for _, stat in entries)
+        limit = self.maxSize * EVICTION_RATIO
+        for path, stat in entries:
+            if size <= limit:
+                break
+            size -= stat.st_size
+            self._remove(path)
+        self._size = size
+
+
+    def clear(self)->None:
+        for path, _ in self._entries():
+            self._remove(path)
+        self._size = 0
+
+
+    def _entries(self)->list:
+        """(path, stat) of each entry."""
+        entries = []
+        try:
+            with os.scandir(self.directory) as dirEntries:
+                for entry in dirEntries:
+                    if not entry.name.endswith(SUFFIX):
+                        continue
+                    try:
+                        entries.append((entry.path, entry.stat()))
+                    except FileNotFoundError:
+                        # Removed by another process.
+                        continue
+        except FileNotFoundError:
+            pass
+        return entries
+
+
+    def _path(self, key)->str:
+        name = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + SUFFIX)
+
+
+    @staticmethod
+    def _touch(path:str)->None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+
+    @staticmethod
+    def _remove(path:str)->None:
+        try:
+            os.remove(path)
+        except OSError:
+            # E.g. removed by another process.
+            pass
@@ -7,7 +7,6 @@ Created on Fri Sep  4 10:29:05 2020
 """
 
 # standard libs
-import pandas as pd
 import numpy as np
 from datetime import datetime
 
@@ -19,6 +18,7 @@ import modules.universal as uni
 
 # Enums
 from c_enum.data_column import DATA_COLUMN
+from c_enum.dialect import DIALECT_SPECTRAL
 
 # constants
 DATETIME_MARKER = "Date and Time"
@@ -36,39 +36,69 @@ class AscReader(BaseReader):
     def _set_columns(self):
         self.xColumn = DATA_COLUMN.PIXEL_COLUMN.value
         self.yColumn = DATA_COLUMN.ASC_DATA_COLUMN.value
+        self.delimiter = DIALECT_SPECTRAL.delimiter
 
 
     def readout_file(self, filename:str)->dict:
+        # Single pass without pandas: The header (parameter) is followed by blank lines and the
+        # tab-separated data. Line endings of any kind are translated by the universal newlines.
+        with open(filename, "r", encoding="utf-8") as ascFile:
+            lines = [line for line in ascFile.read().split("\n") if line.strip()]
 
-        dfFile = pd.read_csv(
-            filename,
-            names = (HEADER_X_DATA, HEADER_Y_DATA),
-            header = None,
-            usecols = [self.xColumn, self.yColumn],
-            dialect = self.dialect,
-            skip_blank_lines = True,
-        )
-
-        self.data = self.data_from_DataFrame(dfFile)
-        parameter = self.parameter_from_DataFrame(dfFile)
+        idxData = next((idx for idx, line in enumerate(lines) if self.delimiter in line), len(lines))
+        if lines and idxData == len(lines):
+            raise ValueError(f"No data found in {filename}.")
+
+        self.data = self.data_from_lines(lines[idxData:])
+        parameter = self.parameter_from_lines(lines[:idxData])
         timeInfo = self.get_time_info(parameter)
 
         information = self.join_information(timeInfo, self.data, parameter)
         return information
 
 
-    def data_from_DataFrame(self, df:pd.DataFrame)->np.ndarray:
-        return df[df[HEADER_Y_DATA].notna()].to_numpy(dtype=float)
+    def readout_header(self, filename:str)->dict:
+        # The header ends with the first data line.
+        lines = []
+        with open(filename, "r", encoding="utf-8") as ascFile:
+            for line in ascFile:
+                if self.delimiter in line:
+                    break
+                if line.strip():
+                    lines.append(line.rstrip("\n"))
+
+        parameter = self.parameter_from_lines(lines)
+        timeInfo = self.get_time_info(parameter)
+        return self.join_information(timeInfo, None, parameter)
+
+
+    def data_from_lines(self, lines:list)->np.ndarray:
+        if not lines:
+            return np.empty((0, 2))
+
+        # Fast path: Exactly two fields in each line.
+        if all(line.count(self.delimiter) == 1 for line in lines):
+            values = self.delimiter.join(lines).split(self.delimiter)
+            return np.array(values, dtype=float).reshape(-1, 2)
+
+        # Additional columns or parameter lines within the data.
+        columns = [self.xColumn, self.yColumn]
+        rows = [line.split(self.delimiter) for line in lines if self.delimiter in line]
+        return np.array([[row[col] for col in columns] for row in rows], dtype=float)
 
 
-    def parameter_from_DataFrame(self, df:pd.DataFrame)->dict:
-        rawParameter = df[df[HEADER_Y_DATA].isna()].to_numpy().T[0]
-        parameter = {descriptor:value for descriptor, value in map(asc_separate_parameter, rawParameter)}
+    def parameter_from_lines(self, lines:list)->dict:
+        # Last one wins for duplicate descriptors.
+        parameter = {descriptor:value for descriptor, value in map(asc_separate_parameter, lines)}
         return parameter
 
 
     def get_time_info(self, parameter:str)->datetime:
-        element = parameter[DATETIME_MARKER]
+        try:
+            element = parameter[DATETIME_MARKER]
+        except KeyError:
+            # E.g. in files without any header.
+            return None
         for timeformat in ASC_TIMESTAMPS:
             try:
                 return uni.timestamp_from_string(element, timeformat)
@@ -8,15 +8,20 @@ Created on Wed Nov  4 22:06:55 2020
 
 
 # standard libs
+import csv
+import io
+import os
 import pandas as pd
 import numpy as np
 
 # third-party libs
 
 # local modules/libs
+import modules.universal as uni
 
 # enums (alphabetical order)
 from c_enum.characteristic import CHARACTERISTIC as CHC
+from c_enum.dialect import DIALECT_CSV
 
 # exceptions
 from exception.InvalidBatchFileError import InvalidBatchFileError
@@ -33,60 +38,231 @@ DROP_NAN_COLUMNS = (
     CHC.PEAK_NAME.value,
     CHC.PEAK_POSITION.value,
 )
+# Number of rows read at once.
+CHUNK_SIZE = 100000
+# The timestamp of the file and the column titles.
+HEADER_LINES = 2
+# Number of bytes read at once by the BaTailReader.
+BLOCK_SIZE = 2**24
+# Number of bytes before the last complete row compared to detect a rewritten file.
+TAIL_BYTES = 1024
 
 
 class BaReader():
+    """
+    Reads a batchfile and provides the data of each peak.
+
+    Only the required columns and the given characteristic(s) are read, all columns if no
+    characteristic is given. The file is read in chunks of CHUNK_SIZE rows.
+
+    Attributes
+    ----------
+    data : dict
+        {peak name: {column: np.ndarray}}, the column of the header info contains the timestamps
+        (datetime64[s]).
+
+    """
 
     ### __Methods__
 
-    def __init__(self, filename:str, characteristic:str=None):
+    def __init__(self, filename:str, characteristic:(str, list)=None):
         super().__init__()
         self.read_batch(filename, characteristic)
 
 
     ### Methods
 
-    def read_batch(self, filename:str, characteristic:str=None)->None:
-        df = self._read_file(filename)
-        self.data = self._data_by_peakname(df)
+    def read_batch(self, filename:str, characteristic:(str, list)=None)->None:
+        columns = self._determine_columns(characteristic)
+        chunks = (self._data_by_peakname(chunk) for chunk in self._read_file(filename, columns))
+        self.data = join_chunks(chunks)
 
 
-    def get_data(self, peak:str, characteristic:str)->(pd.Series, pd.Series):
-        raw_time = self.data[peak][CHC.HEADER_INFO.value]
+    def get_data(self, peak:str, characteristic:str)->(np.ndarray, np.ndarray):
+        """Timestamps (datetime64[s]) and values of the characteristic of the peak (copies)."""
+        time = self.data[peak][CHC.HEADER_INFO.value]
         data = self.data[peak][characteristic]
-
-        time = raw_time.reset_index(drop=True)
-        time = time.to_numpy(dtype='datetime64[s]')
         return time.copy(), data.copy()
 
 
-    def _read_file(self, filename:str)->pd.DataFrame:
-        """Reads the file with default configuration and drops NaN-lines."""
+    def _determine_columns(self, characteristic:(str, list))->set:
+        """The columns to read, None for all columns."""
+        if characteristic is None:
+            return None
+        if isinstance(characteristic, str):
+            characteristic = [characteristic]
+        return set(DROP_NAN_COLUMNS).union(characteristic)
+
+
+    def _read_file(self, filename:str, columns:set=None, skiprows:int=1, **kwargs):
+        """Reads the file in chunks (only the given columns) and drops NaN-lines."""
+        usecols = None if columns is None else (lambda column: column in columns)
         try:
-            df = pd.read_csv(filename, skiprows=1)
+            reader = pd.read_csv(filename, skiprows=skiprows, usecols=usecols, chunksize=CHUNK_SIZE, **kwargs)
         except pd.errors.EmptyDataError:
             raise InvalidBatchFileError from pd.errors.EmptyDataError
 
-        try:
-            df.dropna(subset=DROP_NAN_COLUMNS, inplace=True)
-        except KeyError:
-            raise InvalidBatchFileError from KeyError
+        with reader:
+            for df in reader:
+                try:
+                    df.dropna(subset=DROP_NAN_COLUMNS, inplace=True)
+                except KeyError:
+                    raise InvalidBatchFileError from KeyError
 
-        df[CHC.HEADER_INFO.value] = pd.to_datetime(df[CHC.HEADER_INFO.value], dayfirst=True)
-        return df
+                df[CHC.HEADER_INFO.value] = parse_timestamps(df[CHC.HEADER_INFO.value])
+                yield df
 
 
     def _data_by_peakname(self, df:pd.DataFrame)->dict:
+        """Splits the data by peak name in a single pass: {peak name: {column: np.ndarray}}."""
+        columns = {column: df[column].to_numpy() for column in df.columns}
+        columns[CHC.HEADER_INFO.value] = df[CHC.HEADER_INFO.value].to_numpy(dtype='datetime64[s]')
+        groups = df.groupby(CHC.PEAK_NAME.value, sort=False).indices
+
         data = {}
-        peakNames = self._get_peak_names(df)
-        for peak in peakNames:
-            data[peak] = df.loc[df[CHC.PEAK_NAME.value] == peak]
+        for peak, indices in groups.items():
+            data[peak] = {column: values[indices] for column, values in columns.items()}
         return data
 
 
-    def _get_peak_names(self, df:pd.DataFrame)->set:
+class BaTailReader(BaReader):
+    """
+    Reads a batchfile incrementally.
+
+    Remembers the position of the last complete row. update() parses only the rows appended
+    since then and merges them into data. A truncated or rewritten file is read again
+    completely. A file is rewritten if it was replaced (other inode), or the header or the bytes
+    before the position changed. The modification time changes by appending as well.
+
+    Usage:
+        batch = BaTailReader(filename, characteristic)
+        ...
+        if batch.update():
+            timestamps, values = batch.get_data(peak, characteristic)
+    """
+
+    ### __Methods__
+
+    def __init__(self, filename:str, characteristic:(str, list)=None):
+        self.filename = filename
+        self.characteristic = characteristic
+        self._columns = self._determine_columns(characteristic)
+        super().__init__(filename, characteristic)
+
+
+    ### Methods
+
+    def read_batch(self, filename:str, characteristic:(str, list)=None)->None:
+        self.data = {}
+        self._header = b""
+        self._columnTitles = None
+        self._offset = 0
+        self._inode = None
+        self._tail = b""
+        self.update()
+
+
+    def update(self)->bool:
+        """Reads the appended rows. Returns True if data were added or reloaded."""
+        with open(self.filename, "rb") as batchFile:
+            isRewritten = self._is_rewritten(batchFile)
+            if isRewritten:
+                self.data = {}
+                self._offset = 0
+
+            parts = [self.data]
+            if not self._offset:
+                batchFile.seek(0)
+                self._read_header(batchFile)
+            batchFile.seek(self._offset)
+
+            # The content starts with a row, the incomplete row at the end is kept for the next block.
+            incompleteRow = b""
+            for block in iter(lambda: batchFile.read(BLOCK_SIZE), b""):
+                content = incompleteRow + block
+                end = end_of_complete_rows(content)
+                incompleteRow = content[end:]
+                if not end:
+                    continue
+                parts.extend(self._data_by_peakname(chunk) for chunk in self._read_rows(content[:end]))
+                self._offset += end
+
+            self._inode = os.fstat(batchFile.fileno()).st_ino
+            self._tail = read_before(batchFile, self._offset, TAIL_BYTES)
+
+        self.data = join_chunks(parts)
+        return isRewritten or len(parts) > 1
+
+
+    def _is_rewritten(self, batchFile)->bool:
+        """Checks whether the file was truncated, replaced or rewritten since the last update."""
+        if not self._offset:
+            return False
+
+        stat = os.fstat(batchFile.fileno())
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            return True
+
+        batchFile.seek(0)
+        if batchFile.read(len(self._header)) != self._header:
+            return True
+        return read_before(batchFile, self._offset, len(self._tail)) != self._tail
+
+
+    def _read_header(self, batchFile)->None:
+        lines = [batchFile.readline() for _ in range(HEADER_LINES)]
+        if not lines[-1].endswith(b"\n"):
+            raise InvalidBatchFileError(f"No header found in {self.filename}.")
+
+        self._header = b"".join(lines)
+        self._offset = len(self._header)
+        self._columnTitles = next(csv.reader([lines[-1].decode()], dialect=DIALECT_CSV.name))
+
+
+    def _read_rows(self, content:bytes):
         try:
-            peakNames = set(df[CHC.PEAK_NAME.value])
-        except KeyError:
-            peakNames = set()
-        return peakNames
+            yield from self._read_file(io.BytesIO(content), self._columns, skiprows=0, header=None,
+                                       names=self._columnTitles)
+        except InvalidBatchFileError:
+            if content.strip():
+                raise
+
+
+### module-level functions
+
+def parse_timestamps(timestamps:pd.Series)->pd.Series:
+    """Parses the timestamps of the export format. Other formats (day first) are inferred."""
+    try:
+        return pd.to_datetime(timestamps, format=uni.EXPORT_TIMESTAMP)
+    except ValueError:
+        return pd.to_datetime(timestamps, dayfirst=True)
+
+
+def read_before(file, position:int, size:int)->bytes:
+    """Reads (at most) size bytes before the position of the file."""
+    start = max(position - size, 0)
+    file.seek(start)
+    return file.read(position - start)
+
+
+def end_of_complete_rows(content:bytes)->int:
+    """Position after the last complete row. Linebreaks within quoted fields do not end a row."""
+    end = content.rfind(b"\n")
+    while end >= 0 and content.count(b'"', 0, end) % 2:
+        end = content.rfind(b"\n", 0, end)
+    return end + 1
+
+
+def join_chunks(chunks)->dict:
+    """Joins the data of the chunks of each peak ({peak name: {column: np.ndarray}})."""
+    parts = {}
+    for chunk in chunks:
+        for peak, columns in chunk.items():
+            peakParts = parts.setdefault(peak, {})
+            for column, values in columns.items():
+                peakParts.setdefault(column, []).append(values)
+
+    data = {}
+    for peak, columns in parts.items():
+        data[peak] = {column: np.concatenate(values) for column, values in columns.items()}
+    return data
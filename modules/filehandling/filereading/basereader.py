@@ -41,6 +41,13 @@ class BaseReader(FileFramework):
         self.yColumn = None
 
 
+    def readout_header(self, filename:str)->dict:
+        """Reads the timestamp and the parameter only. Falls back to reading the whole file."""
+        information = self.readout_file(filename)
+        information["data"] = None
+        return information
+
+
     def join_information(self, timeInfo:str, data:list, parameter:dict=None)->dict:
 
         if data is not None:
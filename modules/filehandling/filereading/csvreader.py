@@ -7,7 +7,8 @@ Created on Fri Sep  4 12:11:22 2020
 """
 
 # standard libs
-import pandas as pd
+import csv
+import string
 import numpy as np
 import datetime as dt
 
@@ -20,9 +21,6 @@ from .basereader import BaseReader
 from c_enum.data_column import DATA_COLUMN
 from c_enum.dialect import DIALECT_CSV
 
-# constants
-HEADER_X_DATA = "X"
-HEADER_Y_DATA = "Y"
 
 
 class CsvReader(BaseReader):
@@ -37,6 +35,7 @@ class CsvReader(BaseReader):
 
     def __post_init__(self):
         self.dialect = DIALECT_CSV.name
+        self.delimiter = DIALECT_CSV.delimiter
 
 
     ### Methods
@@ -48,37 +47,68 @@ class CsvReader(BaseReader):
 
 
     def readout_file(self, filename:str)->(str, np.ndarray, dict):
+        # Layout of the FileWriter: The header (timestamp), the information, the column titles and
+        # the data. The data start with the first line beginning with a digit.
+        with open(filename, "r", encoding="utf-8", newline="") as csvFile:
+            lines = [line for line in csvFile.read().splitlines() if line.strip()]
 
-        dfFile = pd.read_csv(
-            filename,
-            names = (HEADER_X_DATA, HEADER_Y_DATA),
-            usecols = [self.xColumn, self.yColumn],
-            dialect = self.dialect,
-            skip_blank_lines = True,
-        )
+        idxData = next((idx for idx, line in enumerate(lines) if line[0] in string.digits), len(lines))
+        if not idxData:
+            raise ValueError(f"No header found in {filename}.")
 
-        numericIndex = self.get_numerical_index(dfFile)
-
-        self.data = self._get_data(dfFile, numericIndex)
-        parameter, timeInfo = self._get_parameter_and_time(dfFile, numericIndex)
+        self.data = self._get_data(lines[idxData:])
+        parameter, timeInfo = self._get_parameter_and_time(lines[:idxData])
 
         return self.join_information(timeInfo, self.data, parameter)
 
 
+    def readout_header(self, filename:str)->dict:
+        # The header ends with the first line beginning with a digit.
+        lines = []
+        with open(filename, "r", encoding="utf-8", newline="") as csvFile:
+            for line in csvFile:
+                if line[0] in string.digits:
+                    break
+                if line.strip():
+                    lines.append(line.rstrip("\r\n"))
+
+        if not lines:
+            raise ValueError(f"No header found in {filename}.")
+
+        parameter, timeInfo = self._get_parameter_and_time(lines)
+        return self.join_information(timeInfo, None, parameter)
+
 
-    def _get_data(self, df:pd.DataFrame, index:pd.Series)->np.ndarray:
-        return df[index].to_numpy(dtype=float)
+    def _get_data(self, lines:list)->np.ndarray:
+        if not lines:
+            return np.empty((0, 2))
 
+        # Fast path: Exactly two fields in each line.
+        if all(line.count(self.delimiter) == 1 for line in lines):
+            values = self.delimiter.join(lines).split(self.delimiter)
+            return np.array(values, dtype=float).reshape(-1, 2)
 
-    def _get_parameter_and_time(self, df:pd.DataFrame, index:pd.Series)->(dict, dt.datetime):
-        rawParameter = df[~index].to_numpy()
+        # Additional columns.
+        columns = [self.xColumn, self.yColumn]
+        rows = csv.reader(lines, dialect=self.dialect)
+        try:
+            data = [[row[col] for col in columns] for row in rows]
+        except IndexError as e:
+            raise ValueError("Invalid data: Too few columns.") from e
+        return np.array(data, dtype=float)
+
+
+    def _get_parameter_and_time(self, lines:list)->(dict, dt.datetime):
+        rawParameter = [pad_row(row) for row in csv.reader(lines, dialect=self.dialect)]
         # Skip the first element (see. time), as well as the last (unused header information).
         parameter = {key:value for key, value in rawParameter[1:-1]}
-        time = self.get_time_info(rawParameter[0, 0])
+        time = self.get_time_info(rawParameter[0][0])
         return parameter, time
 
 
-    @staticmethod
-    def get_numerical_index(df:pd.DataFrame)->pd.Series:
-        """Gets all the indeces with a numerical index."""
-        return df.iloc[:, 0].str.contains("(^[0-9])")
+### module-level functions
+
+def pad_row(row:list)->tuple:
+    """The first two fields of the row. Empty fields are nan (like in pandas)."""
+    row = row + [""] * (2 - len(row))
+    return tuple(field if field else np.nan for field in row[:2])
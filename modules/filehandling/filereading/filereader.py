@@ -7,6 +7,8 @@ Import XY data from different filetypes:
     *.spk/*.Spk
     *.asc
     *.csv
+    *.sif
+Further filetypes can be registered in the ReaderRegistry.
 
 Glossary:
     header: Information about the file itself (filename, date, time).
@@ -17,18 +19,18 @@ Glossary:
 """
 
 # standard libs
-import pandas as pd
+from typing import Generator
 
 # third-party libs
 
 # local modules/libs
+from loader.configloader import ConfigLoader
 # FileFramework: base class.
 from ..fileframework import FileFramework
-# specific subReader
-from .ascreader import AscReader
-from .csvreader import CsvReader
-from .sifreader import SifReader
-from .spkreader import SpkReader
+# specific subReader are imported on first use.
+from .readerregistry import ReaderRegistry
+from .sifparser import read_header
+from . import spectrumcache
 from ..filewriting.spectrumwriter import is_exported_spectrum
 # further modules
 import modules.universal as uni
@@ -41,6 +43,9 @@ from c_enum.suffices import SUFFICES as SUFF
 # exceptions
 from exception.ParameterNotSetError import ParameterNotSetError
 
+# constants
+BATCH = ConfigLoader().BATCH
+
 
 class FileReader(FileFramework):
     """
@@ -54,6 +59,9 @@ class FileReader(FileFramework):
         *.ba
 
     Usage:
+        file = FileReader(filename)
+        # Reads only the header (timestamp and parameter), the data are read on first access.
+        file = FileReader(filename, lazy=True)
 
 
     Attributes
@@ -61,7 +69,8 @@ class FileReader(FileFramework):
     timestamp : datetime or None
         Date and Time formatted as defined in the configuration.
     data : nunpy.array
-        Concats the x- & y-data. First column: x second column: y.
+        Concats the x- & y-data. First column: x second column: y. Read on first access in
+        lazy mode.
     WAVELENGTH : str
         The wavelength if specified in the paramter of the file.
 
@@ -72,13 +81,30 @@ class FileReader(FileFramework):
         Checks whether the file contains valid data.
     determine_subReader()->str:
         Extracts the filetype of the given filename.
-    read_file(**kwargs)->ERROR_CODE:
-        TODO
+    read_file(information:dict=None)->ERROR_CODE:
+        Reads the file or takes the given information (see BaseReader.join_information).
+    read_header()->None:
+        Reads the timestamp and the parameter of the file only.
 
     """
 
+    # Data are read on first access.
+    _isLazy = False
+
     ### Properties
 
+    @property
+    def data(self):
+        if self._isLazy:
+            self._isLazy = False
+            self.read_file()
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+
+
     @property
     def WAVELENGTH(self):
         """Specific value of the parameter set."""
@@ -104,8 +130,12 @@ class FileReader(FileFramework):
         self.__post_init__(**kwargs)
 
 
-    def __post_init__(self, **kwargs):
-        self.read_file(**kwargs)
+    def __post_init__(self, lazy:bool=False, information:dict=None):
+        if lazy and information is None:
+            self.read_header()
+            self._isLazy = True
+        else:
+            self.read_file(information)
 
 
     def __bool__(self):
@@ -132,18 +162,9 @@ class FileReader(FileFramework):
     def determine_subReader(self):
         _, _, suffix = uni.extract_path_basename_suffix(self.filename)
 
-        if suffix == SUFF.CSV.value:
-            subReader = CsvReader()
-        elif suffix == SUFF.SPK.value:
-            subReader = SpkReader()
-        elif suffix == SUFF.ASC.value:
-            subReader = AscReader()
-        elif suffix == SUFF.SIF.value:
-            subReader = SifReader()
-        else:
+        subReader = ReaderRegistry().get_reader(suffix, self.filename)
+        if subReader is None:
             self._logger.warning("Unknown suffix: %s.", suffix)
-            return None
-
         return subReader
 
 
@@ -170,12 +191,67 @@ class FileReader(FileFramework):
         return not is_exported_spectrum(self.filename)
 
 
-    def read_file(self, **kwargs)->ERR:
+    def read_header(self)->None:
         try:
-            fileinformation = self.subReader.readout_file(self.filename)
-        except (AttributeError, pd.errors.ParserError):
+            fileinformation = self.subReader.readout_header(self.filename)
+        except (AttributeError, ValueError):
             return
 
+        self.timeInfo = fileinformation["timeInfo"]
+        self.parameter = fileinformation.get("parameter", {})
+
+
+    def read_file(self, information:dict=None)->ERR:
+        """
+        Reads the file. Already read information (e.g. of a single frame) can be given instead.
+
+        Consults the spectrum cache first (if enabled).
+        """
+        fileinformation = information or spectrumcache.load(self.filename)
+        if fileinformation is None:
+            try:
+                fileinformation = self.subReader.readout_file(self.filename)
+            except (AttributeError, ValueError):
+                # ValueError includes the ParserError of pandas.
+                return
+            spectrumcache.store(self.filename, fileinformation)
+
         self.timeInfo = fileinformation["timeInfo"]
         self.data = fileinformation["data"]
         self.parameter = fileinformation.get("parameter", {})
+
+
+def is_kinetic_series(filename:str)->bool:
+    """Checks whether the file is a .sif file with several frames (kinetic series)."""
+    _, _, suffix = uni.extract_path_basename_suffix(filename)
+    if suffix != SUFF.SIF.value:
+        return False
+    try:
+        _, _, noImages, _ = read_header(filename)
+        return noImages > 1
+    except (OSError, SyntaxError, ValueError):
+        # Missing and invalid files are handled by the FileReader.
+        return False
+
+
+def read_frames(filename:str)->Generator[FileReader, None, None]:
+    """
+    Reads the frames of a kinetic series one by one.
+
+    Each frame is a spectrum of its own, labeled with the filename and the (1-based) index of
+    the frame like "file.sif:   1". Only the current frame is kept in memory.
+    """
+    reader = ReaderRegistry().get_reader(SUFF.SIF.value)
+    for idx, information in enumerate(reader.readout_frames(filename)):
+        frame = FileReader(filename, information=information)
+        frame.filename = frame_label(filename, idx)
+        yield frame
+
+
+def frame_label(filename:str, idx:int)->str:
+    return filename + BATCH["SEPARATOR"] + format(idx + 1, BATCH["INDEX_FORMAT"])
+
+
+def frame_source(label:str)->str:
+    """The file of the frame labelled by frame_label."""
+    return label.rpartition(BATCH["SEPARATOR"])[0]
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Registry of the readers of spectra.
+
+Readers are registered by suffix as "module:Class" and imported on first use. Files with an
+unknown suffix are identified by their magic bytes (if registered).
+
+Further formats are provided by other packages via the entry point group "oes_spa.readers":
+The name of the entry point is the suffix, the object a subclass of BaseReader, e.g.
+
+    [options.entry_points]
+    oes_spa.readers =
+        spe = mypackage.spereader:SpeReader
+
+Usage:
+    from modules.filehandling.filereading.readerregistry import ReaderRegistry
+    reader = ReaderRegistry().get_reader(suffix, filename)
+
+Created on Sun Oct 18 14:21:05 2026
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+import importlib
+import logging
+from importlib import metadata
+
+# third-party libs
+
+# local modules/libs
+from c_metaclass.singleton import Singleton
+
+# Enums
+from c_enum.suffices import SUFFICES as SUFF
+
+# constants
+ENTRY_POINT_GROUP = "oes_spa.readers"
+READERS = {
+    SUFF.ASC.value: "modules.filehandling.filereading.ascreader:AscReader",
+    SUFF.CSV.value: "modules.filehandling.filereading.csvreader:CsvReader",
+    SUFF.SIF.value: "modules.filehandling.filereading.sifreader:SifReader",
+    SUFF.SPK.value: "modules.filehandling.filereading.spkreader:SpkReader",
+}
+MAGIC_BYTES = {
+    b"Andor Technology Multi-Channel File\n": SUFF.SIF.value,
+}
+
+
+class ReaderRegistry(metaclass=Singleton):
+
+    ### __methods__
+
+    def __init__(self)->None:
+        self._logger = logging.getLogger(self.__class__.__name__)
+        # suffix: "module:Class", EntryPoint or class.
+        self._readers = dict(READERS)
+        self._magicBytes = dict(MAGIC_BYTES)
+        self._classes = {}
+        self._load_entry_points()
+
+
+    ### Methods
+
+    def register(self, suffix:str, reader, magic:bytes=None)->None:
+        """Registers the reader (class or "module:Class") for the suffix and optional magic bytes."""
+        suffix = suffix.lower()
+        self._readers[suffix] = reader
+        self._classes.pop(suffix, None)
+        if magic:
+            self._magicBytes[magic] = suffix
+
+
+    def has_reader(self, suffix:str)->bool:
+        return suffix in self._readers
+
+
+    def get_reader(self, suffix:str, filename:str=None):
+        """
+        A new reader of the suffix. If no reader is registered for the suffix, the reader is
+        determined by the magic bytes of the file. None if no reader is found.
+        """
+        if not self.has_reader(suffix) and filename is not None:
+            suffix = self.suffix_by_magic_bytes(filename)
+
+        readerClass = self._get_class(suffix)
+        return readerClass() if readerClass else None
+
+
+    def suffix_by_magic_bytes(self, filename:str)->str:
+        length = max(map(len, self._magicBytes), default=0)
+        try:
+            with open(filename, "rb") as file:
+                head = file.read(length)
+        except OSError:
+            return None
+
+        for magic, suffix in self._magicBytes.items():
+            if head.startswith(magic):
+                return suffix
+        return None
+
+
+    def _get_class(self, suffix:str):
+        try:
+            return self._classes[suffix]
+        except KeyError:
+            pass
+
+        reader = self._readers.get(suffix)
+        if reader is None:
+            return None
+
+        if isinstance(reader, str):
+            moduleName, _, className = reader.partition(":")
+            readerClass = getattr(importlib.import_module(moduleName), className)
+        elif isinstance(reader, metadata.EntryPoint):
+            readerClass = reader.load()
+        else:
+            readerClass = reader
+
+        self._classes[suffix] = readerClass
+        return readerClass
+
+
+    def _load_entry_points(self)->None:
+        """Registers the readers of other packages. The modules are imported on first use."""
+        entryPoints = metadata.entry_points()
+        if hasattr(entryPoints, "select"):
+            entryPoints = entryPoints.select(group=ENTRY_POINT_GROUP)
+        else:
+            # Python < 3.10
+            entryPoints = entryPoints.get(ENTRY_POINT_GROUP, [])
+
+        for entryPoint in entryPoints:
+            self._logger.info("Register reader of %s: %s", entryPoint.name, entryPoint.value)
+            self.register(entryPoint.name, entryPoint)
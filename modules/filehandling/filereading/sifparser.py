@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parser of Andor Technology Multi-Channel files (.sif).
+
+Port of sif_reader (dependencies/sif_reader) with the same results. The file is read at once
+and the header is parsed by offsets within the buffer instead of one read per byte. The
+intensities are a view of the buffer.
+
+Frames of kinetic series are provided one by one from the memory-mapped file (iter_frames).
+
+Usage:
+    from modules.filehandling.filereading.sifparser import np_open, iter_frames
+    intensities, info = np_open(filename)
+    for idx, info, intensities in iter_frames(filename):
+        ...
+
+Created on Sun Oct 18 11:05:12 2026
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+import mmap
+from collections import OrderedDict
+
+import numpy as np
+
+# third-party libs
+
+# local modules/libs
+
+# constants
+MAGIC = b'Andor Technology Multi-Channel File\n'
+DATA_TYPE = np.dtype('<f4')
+
+
+class SifBuffer():
+    """Provides the reading methods of a file on a buffer, positioned by an offset."""
+
+    def __init__(self, buffer:bytes)->None:
+        self.buffer = buffer
+        self.offset = 0
+
+
+    def read(self, length:int)->bytes:
+        data = self.buffer[self.offset:self.offset+length]
+        self.offset += len(data)
+        return data
+
+
+    def readline(self)->bytes:
+        end = self.buffer.find(b'\n', self.offset)
+        end = len(self.buffer) if end == -1 else end + 1
+        return self.read(end - self.offset)
+
+
+    def read_until(self, terminator:bytes=b' ')->bytes:
+        """Reads a word delimited by the terminator or a newline. Leading delimiters belong to the word."""
+        # The first character belongs to the word in any case.
+        start = self.offset + 1
+        ends = [idx for idx in (self.buffer.find(terminator, start), self.buffer.find(b'\n', start)) if idx > -1]
+        if not ends:
+            raise SyntaxError("Unexpected end of the SIF file.")
+        end = min(ends)
+        word = self.buffer[self.offset:end]
+        # Skip the terminator.
+        self.offset = end + 1
+        return word
+
+
+    def read_int(self)->int:
+        return int(self.read_until(b' '))
+
+
+    def read_float(self)->float:
+        return float(self.read_until(b' '))
+
+
+    def read_string(self, length:int=None)->bytes:
+        """Reads a string of the given length. If no length is provided, the length is read from the file."""
+        if length is None:
+            length = int(self.readline())
+        return self.read(length)
+
+
+def np_open(filename:str)->(np.ndarray, OrderedDict):
+    """
+    Reads the sif file.
+
+    Returns
+    -------
+    data : np.ndarray
+        Intensities of all frames (frames x height x width), read-only.
+    info : OrderedDict
+        Parameter of the file, see sif_reader.
+
+    """
+    with open(filename, 'rb') as sifFile:
+        buffer = sifFile.read()
+
+    offset, size, noImages, info = parse_header(SifBuffer(buffer))
+    count = noImages * size[0] * size[1]
+    data = np.frombuffer(buffer, dtype=DATA_TYPE, count=count, offset=offset)
+    return data.reshape(noImages, size[1], size[0]), info
+
+
+def read_header(filename:str)->tuple:
+    """Reads the header without the image data. Returns (offset, size, noImages, info) as of parse_header."""
+    with open(filename, 'rb') as sifFile, mmap.mmap(sifFile.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        return parse_header(SifBuffer(buffer))
+
+
+def iter_frames(filename:str):
+    """
+    Yields (index, info, intensities) of each frame of the file.
+
+    The file is memory-mapped and only the current frame (height x width) is loaded. info is
+    the same for all frames, the time of a frame is given by 'timestamp_of_<index>' in µs
+    relative to the 'ExperimentTime'.
+    """
+    with open(filename, 'rb') as sifFile, mmap.mmap(sifFile.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        offset, size, noImages, info = parse_header(SifBuffer(buffer))
+        count = size[0] * size[1]
+        for idx in range(noImages):
+            frameOffset = offset + idx * count * DATA_TYPE.itemsize
+            # Copy the frame, the memory map cannot be closed with views on it.
+            frame = np.array(np.frombuffer(buffer, dtype=DATA_TYPE, count=count, offset=frameOffset))
+            yield idx, info, frame.reshape(size[1], size[0])
+
+
+def parse_header(fp:SifBuffer)->tuple:
+    """
+    Parses the header of a sif file.
+
+    Returns
+    -------
+    (offset, size, noImages, info)
+        offset of the image data, size (width, height) of a frame, the number of frames and the
+        information of the header.
+
+    """
+    info = OrderedDict()
+
+    if fp.read(36) != MAGIC:
+        raise SyntaxError('not a SIF file')
+
+    # What's this?
+    fp.readline() # 65538 number_of_images?
+
+    info['SifVersion'] = fp.read_int() # 65559
+
+    # What's this?
+    fp.read_until(b' ') # 0
+    fp.read_until(b' ') # 0
+    fp.read_until(b' ') # 1
+
+    info['ExperimentTime'] = fp.read_int()
+    info['DetectorTemperature'] = fp.read_float()
+
+    # What is this?
+    fp.read_string(10) # blank
+
+    # What is this?
+    fp.read_until(b' ') # 0
+
+    info['ExposureTime'] = fp.read_float()
+    info['CycleTime'] = fp.read_float()
+    info['AccumulatedCycleTime'] = fp.read_float()
+    info['AccumulatedCycles'] = fp.read_int()
+
+    fp.read(1) # NULL
+    fp.read(1) # space
+
+    info['StackCycleTime'] = fp.read_float()
+    info['PixelReadoutTime'] = fp.read_float()
+
+    # What is this?
+    fp.read_until(b' ') # 0
+    fp.read_until(b' ') # 1
+    info['GainDAC'] = fp.read_float()
+
+    # What is the rest of the line?
+    fp.read_until(b'\n')
+
+    info['DetectorType'] = fp.readline().decode('utf-8')
+    info['DetectorDimensions'] = (fp.read_int(), fp.read_int())
+    info['OriginalFilename'] = fp.read_string()
+
+    # What is this?
+    fp.read(2) # space newline
+
+    # What is this?
+    fp.read_int() # 65538
+    info['user_text'] = fp.read_string()
+
+    fp.read(1) # newline
+    fp.read_int() # 65538
+    fp.read(8) # 0x01 space 0x02 space 0x03 space 0x00 space
+    info['ShutterTime'] = (fp.read_float(), fp.read_float()) # ends in newline
+
+    for _ in range(skipped_lines(info['SifVersion'])):
+        fp.readline()
+
+    info['SifCalbVersion'] = fp.read_int() # 65539
+    # additional skip for this version
+    if info['SifCalbVersion'] == 65540:
+        fp.readline()
+
+    # 4th-order polynomial coefficients
+    info['Calibration_data'] = fp.readline()
+
+    fp.readline() # 0 1 0 0 newline
+    fp.readline() # 0 1 0 0 newline
+    fp.readline() # 0 1 0 0 newline
+
+    fp.readline() # 422 newline or 433 newline
+
+    fp.readline() # 13 newline
+    fp.readline() # 13 newline
+
+    info['FrameAxis'] = fp.read_string()
+    info['DataType'] = fp.read_string()
+    info['ImageAxis'] = fp.read_string()
+
+    fp.read_until(b' ') # 65541
+
+    fp.read_until(b' ') # x0? left? -> x0
+    fp.read_until(b' ') # x1? bottom? -> y1
+    fp.read_until(b' ') # y1? right? -> x1
+    fp.read_until(b' ') # y0? top? -> y0
+
+    noImages = fp.read_int()
+    noSubimages = fp.read_int()
+    fp.read_int() # total length
+    fp.read_int() # image length
+    info['NumberOfFrames'] = noImages
+
+    for _ in range(noSubimages):
+        # read subimage information
+        fp.read_until(b' ') # 65538
+
+        frameArea = fp.readline().strip().split()
+        x0, y1, x1, y0, ybin, xbin = map(int, frameArea[:6])
+        width = int((1 + x1 - x0) / xbin)
+        height = int((1 + y1 - y0) / ybin)
+    size = (int(width), int(height) * noSubimages)
+
+    for f in range(noImages):
+        info['timestamp_of_{0:d}'.format(f)] = int(fp.readline())
+
+    offset = fp.offset
+    try:
+        # remove extra 0 if it exits.
+        flag = int(fp.readline())
+        if flag == 0:
+            offset = fp.offset
+        # remove another extra 1
+        if flag == 1:
+            fp.readline()
+            offset = fp.offset
+    except ValueError:
+        fp.offset = offset
+
+    info = extract_user_text(info)
+
+    return offset, size, noImages, info
+
+
+def skipped_lines(sifVersion:int)->int:
+    """Number of lines between the shutter time and the calibration depending on the version."""
+    if 65548 <= sifVersion <= 65557:
+        return 2
+    elif sifVersion == 65558:
+        return 5
+    elif sifVersion == 65559:
+        return 9
+    elif sifVersion == 65565:
+        return 15
+    elif sifVersion > 65565:
+        return 18
+    return 0
+
+
+def extract_user_text(info:OrderedDict)->OrderedDict:
+    """
+    Extract known information from info['user_text'].
+    Current known info is
+    + 'Calibration data for frame %d'
+    """
+    userText = info['user_text']
+    if b'Calibration data for' in userText[:20]:
+        texts = userText.split(b'\n')
+        for i in range(info['NumberOfFrames']):
+            key = 'Calibration_data_for_frame_{:d}'.format(i+1)
+            coefs = texts[i][len(key)+2:].strip().split(b',')
+            info[key] = [float(c) for c in coefs]
+        # Calibration data should be None for this case
+        info['Calibration_data'] = None
+    else:
+        coefs = info['Calibration_data'].strip().split()
+        try:
+            info['Calibration_data'] = [float(c) for c in coefs]
+        except ValueError:
+            del info['Calibration_data']
+    del info['user_text']
+    return info
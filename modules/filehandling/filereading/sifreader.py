@@ -10,12 +10,13 @@ Created on Sat Feb 13 14:56:33 2021
 # standard libs
 import numpy as np
 from datetime import datetime
+from typing import Generator
 
 # third-party libs
-import sif_reader
 
 # local modules/libs
 from .basereader import BaseReader
+from .sifparser import np_open, iter_frames, read_header
 import modules.universal as uni
 
 # Enums
@@ -24,6 +25,8 @@ from c_enum.asc_parameter import ASC_PARAMETER as ASC
 # constants
 NAME_TIME = "ExperimentTime"
 CALIBRATION_FACTORS = "Calibration_data"
+FRAME_CALIBRATION_FACTORS = "Calibration_data_for_frame_{:d}"
+FRAME_TIMESTAMP = "timestamp_of_{:d}"
 
 
 
@@ -33,7 +36,7 @@ class SifReader(BaseReader):
     ### Methods
 
     def readout_file(self, filename:str)->dict:
-        intensities, parameter = sif_reader.np_open(filename)
+        intensities, parameter = np_open(filename)
 
         wavelength, intensities = self._format_and_calibrate(intensities, parameter)
         timeInfo = self._format_time(parameter)
@@ -43,6 +46,37 @@ class SifReader(BaseReader):
         return self.join_information(timeInfo, np.array([wavelength, intensities]).T, parameter)
 
 
+    def readout_header(self, filename:str)->dict:
+        _, size, noImages, parameter = read_header(filename)
+
+        wavelength = self._calibrate(noImages * size[0] * size[1], parameter)
+        timeInfo = self._format_time(parameter)
+        parameter[ASC.WL.value] = self._central_wavelength(wavelength)
+
+        return self.join_information(timeInfo, None, parameter)
+
+
+    def readout_frames(self, filename:str)->Generator[dict, None, None]:
+        """
+        Reads the frames of a kinetic series one by one.
+
+        Each frame is a spectrum of its own with the time of the frame and its calibration.
+        Only the current frame is loaded from the file.
+        """
+        for idx, info, intensities in iter_frames(filename):
+            parameter = info.copy()
+            parameter[NAME_TIME] = info[NAME_TIME] + info[FRAME_TIMESTAMP.format(idx)] * 1e-6
+            frameFactors = info.get(FRAME_CALIBRATION_FACTORS.format(idx + 1))
+            if frameFactors is not None:
+                parameter[CALIBRATION_FACTORS] = frameFactors
+
+            wavelength, intensities = self._format_and_calibrate(intensities, parameter)
+            timeInfo = self._format_time(parameter)
+            parameter[ASC.WL.value] = self._central_wavelength(wavelength)
+
+            yield self.join_information(timeInfo, np.array([wavelength, intensities]).T, parameter)
+
+
     def _format_time(self, parameter:dict)->str:
         """Formats the time in-place in parameter and also returns it."""
         timeInfo_ms = parameter[NAME_TIME]
@@ -54,7 +88,7 @@ class SifReader(BaseReader):
     def _format_and_calibrate(self, intensities:np.ndarray, parameter:dict):
         """Formats the intensities and calibrate the wavelenght by specified parameter."""
         intensities = self._format_intensities(intensities)
-        wavelength = self._calibrate(intensities, parameter)
+        wavelength = self._calibrate(intensities.size, parameter)
         return wavelength, intensities
 
 
@@ -62,8 +96,8 @@ class SifReader(BaseReader):
         return intensities.flatten()
 
 
-    def _calibrate(self, intensities:np.ndarray, parameter:dict):
-        pixel = np.arange(1, intensities.size + 1)
+    def _calibrate(self, noPixels:int, parameter:dict):
+        pixel = np.arange(1, noPixels + 1)
         factors = parameter[CALIBRATION_FACTORS]
         return self._sif_calibration(pixel, factors)
 
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache of parsed spectra on the disk (opt-in).
+
+The information of a spectrum (timeInfo, data, parameter) is stored in binary form, keyed by
+the path, the size and the modification time of the file. A modified file therefore misses
+the cache. The cache is enabled by the directory in the configuration:
+
+    GENERAL:
+      SPECTRUM_CACHE_DIR: ./.cache/spectra
+      SPECTRUM_CACHE_SIZE_MB: 500
+
+Usage:
+    from modules.filehandling.filereading import spectrumcache
+    information = spectrumcache.load(filename)  # None if not cached
+    spectrumcache.store(filename, information)
+
+Created on Sun Oct 18 13:52:40 2026
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+import os
+from functools import lru_cache
+
+# third-party libs
+
+# local modules/libs
+from loader.configloader import ConfigLoader
+from ..diskcache import DiskCache
+
+# constants
+# Increase if the readers return different information. Invalidates all entries.
+CACHE_VERSION = 1
+MEGABYTE = 2**20
+
+
+@lru_cache(maxsize=1)
+def get_cache()->DiskCache:
+    """The spectrum cache as configured, None if disabled."""
+    config = ConfigLoader()
+    directory = config.spectrumCacheDir
+    if not directory:
+        return None
+    return DiskCache(directory, config.spectrumCacheSize * MEGABYTE)
+
+
+def load(filename:str)->dict:
+    """The cached information of the file. None if disabled, not cached or outdated."""
+    cache = get_cache()
+    if cache is None:
+        return None
+
+    try:
+        key = cache_key(filename)
+    except OSError:
+        return None
+    return cache.get(key)
+
+
+def store(filename:str, information:dict)->None:
+    cache = get_cache()
+    if cache is None:
+        return
+
+    try:
+        key = cache_key(filename)
+    except OSError:
+        return
+    cache.set(key, information)
+
+
+def cache_key(filename:str)->tuple:
+    stat = os.stat(filename)
+    return (CACHE_VERSION, os.path.abspath(filename), stat.st_size, stat.st_mtime_ns)
@@ -7,7 +7,7 @@ Created on Fri Sep  4 12:11:22 2020
 """
 
 # standard libs
-import pandas as pd
+import numpy as np
 
 # third-party libs
 
@@ -16,6 +16,10 @@ from .basereader import BaseReader
 
 # Enums
 from c_enum.data_column import DATA_COLUMN
+from c_enum.dialect import DIALECT_SPECTRAL
+
+# constants
+HEADER_LINES = 3
 
 class SpkReader(BaseReader):
 
@@ -25,22 +29,45 @@ class SpkReader(BaseReader):
     def _set_columns(self):
         self.xColumn = DATA_COLUMN.PIXEL_COLUMN.value
         self.yColumn = DATA_COLUMN.SPK_DATA_COLUMN.value
+        self.delimiter = DIALECT_SPECTRAL.delimiter
 
 
     def readout_file(self, filename:str)->dict:
+        # The file is read once: The timestamp is in the first line, the data start after the
+        # header of 3 lines.
+        with open(filename, "r", encoding="utf-8") as spkFile:
+            lines = spkFile.read().split("\n")
 
-        timeInfo = pd.read_csv(filename, dialect=self.dialect, nrows=1, header=None).loc[0,0]
+        timeInfo = lines[0].split(self.delimiter)[0]
         timeInfo = self.get_time_info(timeInfo)
 
-        dfFile = pd.read_csv(
-            filename,
-            header = None,
-            usecols = [self.xColumn, self.yColumn],
-            skiprows = 3,
-            dialect = self.dialect,
-            skip_blank_lines = True
-        )
-        self.data = dfFile.to_numpy()
+        self.data = self.data_from_lines(lines[HEADER_LINES:])
 
         information = self.join_information(timeInfo, self.data)
         return information
+
+
+    def readout_header(self, filename:str)->dict:
+        with open(filename, "r", encoding="utf-8") as spkFile:
+            firstLine = spkFile.readline()
+
+        timeInfo = self.get_time_info(firstLine.split(self.delimiter)[0])
+        return self.join_information(timeInfo, None)
+
+
+    def data_from_lines(self, lines:list)->np.ndarray:
+        columns = [self.xColumn, self.yColumn]
+        rows = [line.split(self.delimiter) for line in lines if line.strip()]
+        if not rows:
+            raise ValueError("No data found.")
+
+        try:
+            data = [[row[col] for col in columns] for row in rows]
+        except IndexError as e:
+            raise ValueError("Invalid data: Too few columns.") from e
+
+        try:
+            return np.array(data, dtype=float)
+        except ValueError:
+            # E.g. time data, converted when joining the information.
+            return np.array(data)
@@ -9,6 +9,7 @@ Created on Thu Sep 24 10:02:18 2020
 # standard libs
 import csv
 from datetime import datetime
+from itertools import islice
 
 # third-party libs
 
@@ -17,9 +18,14 @@ from .filewriter import FileWriter
 
 # Enums
 
+# exceptions
+from exception.InvalidBatchFileError import InvalidBatchFileError
+
 # constants
 
 BATCH_MARKER = "Filename"
+# The column titles are expected within the first rows (timestamp, information, titles).
+MAX_HEADER_LINES = 10
 
 
 class BatchWriter(FileWriter):
@@ -27,6 +33,9 @@ class BatchWriter(FileWriter):
     Writer for batchfiles.
 
     Can either export a set of data, or add data to an existing batchfile.
+
+    Appending is independent of the size of the batchfile: Only the header is validated, the
+    rows are appended to the end of the file.
     """
 
     def __init__(self, filename:str)->None:
@@ -47,10 +56,19 @@ class BatchWriter(FileWriter):
 
 
     def extend_data(self, data:list, columnTitles:list=None)->None:
-        if self.is_valid_batchfile():
-            self.append_data(data)
-        else:
-            self.export([data], columnTitles)
+        """
+        Appends the data to the batchfile, exports a new batchfile if there is no valid one.
+
+        Raises InvalidBatchFileError if the column titles do not match the batchfile.
+        """
+        titles = self.read_column_titles()
+        if titles is None:
+            self.export(data, columnTitles)
+            return
+
+        if columnTitles and list(columnTitles) != titles:
+            raise InvalidBatchFileError(f"Columns do not match the batchfile: {self.filename}")
+        self.append_data(data)
 
 
     def append_data(self, data:list)->None:
@@ -59,15 +77,18 @@ class BatchWriter(FileWriter):
             writer.writerows(data)
 
 
-    def is_valid_batchfile(self)->None:
+    def is_valid_batchfile(self)->bool:
+        return self.read_column_titles() is not None
+
+
+    def read_column_titles(self)->list:
+        """The column titles of the batchfile, None if not found. Only the header is read."""
         try:
             with open(self.filename, 'r', newline='') as f:
                 fReader = csv.reader(f, dialect=self.dialect)
-                for line in fReader:
+                for line in islice(fReader, MAX_HEADER_LINES):
                     if BATCH_MARKER in line:
-                        break
-                else:
-                    return False
+                        return line
         except FileNotFoundError:
             pass
-        return True
+        return None
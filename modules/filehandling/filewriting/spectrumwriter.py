@@ -16,7 +16,6 @@ from datetime import datetime
 # FileWriter: base class.
 from .filewriter import FileWriter
 import modules.universal as uni
-from ...dataanalysis.spectrum import Spectrum
 
 # Enums
 from c_enum.export_type import EXPORT_TYPE
@@ -35,7 +34,7 @@ class SpectrumWriter(FileWriter):
         super().__init__(filename, timestamp)
 
 
-    def export(self, spectrum:Spectrum, extraInformation:dict=None)->str:
+    def export(self, spectrum, extraInformation:dict=None)->str:
         """
         Parameters
         ----------
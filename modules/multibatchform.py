@@ -104,7 +104,8 @@ class MultiBatchForm(QWidget):
         data = []
         for batchfile, settings in settings.items():
             try:
-                batch = BaReader(filename=batchfile)
+                characteristics = [s.characteristic for s in settings]
+                batch = BaReader(filename=batchfile, characteristic=characteristics)
             except (FileNotFoundError, InvalidBatchFileError):
                 continue
 
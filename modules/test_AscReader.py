@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testing the reading of asc files.
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+import unittest
+
+# third-party libs
+import numpy as np
+
+# local modules/libs
+from modules.filehandling.filereading.ascreader import AscReader
+
+
+class TestAscReader(unittest.TestCase):
+
+    def test_data_from_lines(self):
+        reader = AscReader()
+        np.testing.assert_array_equal(reader.data_from_lines(["1\t2", "3\t4"]), [[1, 2], [3, 4]])
+
+
+    def test_uneven_rows(self):
+        # Additional columns are omitted, lines without delimiter are no data.
+        data = AscReader().data_from_lines(["1\t2\t3", "4", "5\t6"])
+        np.testing.assert_array_equal(data, [[1, 2], [5, 6]])
+
+
+if __name__ == '__main__':
+    unittest.main()
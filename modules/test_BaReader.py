@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testing the (incremental) reading of batchfiles.
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+import os
+import tempfile
+import unittest
+
+# third-party libs
+import numpy as np
+
+# local modules/libs
+from modules.filehandling.filereading.bareader import BaReader, BaTailReader, end_of_complete_rows
+
+# constants
+HEADER = (b"Date 18.10.2026 08:46:15\n"
+          b"Baseline,Peak name,Peak area,Peak height,Peak position,Calibration peaks,Filename,Header info\n")
+ROWS = (
+    b'1.0,CH Peak,10.0,5.0,431.0,"[387.8 388.1\n 389.5]",a.asc,01.12.2018 16:48:36\n',
+    b'1.0,CN Peak,20.0,6.0,388.0,"[387.8 388.1\n 389.5]",a.asc,01.12.2018 16:48:36\n',
+    b'2.0,CH Peak,11.0,5.5,431.0,"[387.8 388.1\n 389.5]",b.asc,01.12.2018 16:50:36\n',
+)
+
+
+class TestBaReader(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix=".ba")
+        os.close(fd)
+
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+
+    def write(self, content:bytes, mode:str="wb"):
+        with open(self.filename, mode) as batchFile:
+            batchFile.write(content)
+
+
+    def test_end_of_complete_rows(self):
+        content = ROWS[0] + ROWS[1][:40]
+        self.assertEqual(end_of_complete_rows(content), len(ROWS[0]))
+        self.assertEqual(end_of_complete_rows(ROWS[0][:40]), 0)
+
+
+    def test_projection(self):
+        self.write(HEADER + b"".join(ROWS))
+        batch = BaReader(self.filename, characteristic="Peak area")
+        self.assertEqual(list(batch.data), ["CH Peak", "CN Peak"])
+        self.assertNotIn("Calibration peaks", batch.data["CH Peak"])
+        _, values = batch.get_data("CH Peak", "Peak area")
+        np.testing.assert_array_equal(values, [10.0, 11.0])
+
+
+    def test_tail(self):
+        # The second row is written partially.
+        self.write(HEADER + ROWS[0] + ROWS[1][:40])
+        batch = BaTailReader(self.filename, characteristic="Peak area")
+        self.assertEqual(list(batch.data), ["CH Peak"])
+        self.assertFalse(batch.update())
+
+        self.write(ROWS[1][40:] + ROWS[2], mode="ab")
+        self.assertTrue(batch.update())
+        timestamps, values = batch.get_data("CH Peak", "Peak area")
+        np.testing.assert_array_equal(values, [10.0, 11.0])
+        self.assertEqual(timestamps[1] - timestamps[0], np.timedelta64(120, "s"))
+
+
+    def test_rewrite(self):
+        self.write(HEADER + b"".join(ROWS))
+        batch = BaTailReader(self.filename, characteristic="Peak area")
+        self.write(HEADER.replace(b"08:46:15", b"09:00:00") + ROWS[1])
+        self.assertTrue(batch.update())
+        self.assertEqual(list(batch.data), ["CN Peak"])
+
+
+    def test_rewrite_same_header(self):
+        # Rewritten within the same second (same header) and larger than before.
+        self.write(HEADER + ROWS[0])
+        batch = BaTailReader(self.filename, characteristic="Peak area")
+        self.write(HEADER + ROWS[1] + ROWS[2])
+        self.assertTrue(batch.update())
+        self.assertEqual(sorted(batch.data), ["CH Peak", "CN Peak"])
+        _, values = batch.get_data("CH Peak", "Peak area")
+        np.testing.assert_array_equal(values, [11.0])
+
+        # Replaced by another file, the content of the former rows is the same.
+        fd, tmpFilename = tempfile.mkstemp(suffix=".ba")
+        with os.fdopen(fd, "wb") as batchFile:
+            batchFile.write(HEADER + ROWS[1] + ROWS[2] + ROWS[0])
+        os.replace(tmpFilename, self.filename)
+        self.assertTrue(batch.update())
+        _, values = batch.get_data("CH Peak", "Peak area")
+        np.testing.assert_array_equal(values, [11.0, 10.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
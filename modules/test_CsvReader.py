@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testing the reading of csv files.
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+import unittest
+
+# third-party libs
+import numpy as np
+
+# local modules/libs
+from modules.filehandling.filereading.csvreader import CsvReader
+from modules.filehandling.filereading.filereader import FileReader
+
+# constants
+TEST_DIR = "./modules/testfiles/"
+
+
+class TestCsvReader(unittest.TestCase):
+
+    def test_too_few_columns(self):
+        # Rows with fewer fields than the columns of x- and y-data.
+        filename = TEST_DIR + "csvfile_1.csv"
+        with self.assertRaises(ValueError):
+            CsvReader().readout_file(filename)
+
+        file = FileReader(filename)
+        self.assertIsNone(file.data)
+
+
+    def test_uneven_rows(self):
+        # 4 fields in 2 rows must not be paired as x- and y-data.
+        with self.assertRaises(ValueError):
+            CsvReader()._get_data(["1,2,3", "4"])
+        np.testing.assert_array_equal(CsvReader()._get_data(["1,2", "3,4"]), [[1, 2], [3, 4]])
+
+
+if __name__ == '__main__':
+    unittest.main()
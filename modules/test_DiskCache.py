@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testing the size-bounded disk cache.
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+import os
+import tempfile
+import unittest
+
+# third-party libs
+import numpy as np
+
+# local modules/libs
+from modules.filehandling.diskcache import DiskCache
+
+
+class TestDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpDir = tempfile.TemporaryDirectory()
+        self.directory = self.tmpDir.name
+
+
+    def tearDown(self):
+        self.tmpDir.cleanup()
+
+
+    def test_get_set(self):
+        cache = DiskCache(self.directory, maxSize=2**20)
+        self.assertIsNone(cache.get("key"))
+        data = np.arange(10.0)
+        cache.set("key", {"data": data})
+        np.testing.assert_array_equal(cache.get("key")["data"], data)
+
+
+    def test_eviction(self):
+        cache = DiskCache(self.directory, maxSize=2**20)
+        for key in range(3):
+            cache.set(key, np.zeros(2**16))
+            # Older entries have an older access time.
+            os.utime(cache._path(key), ns=(key, key))
+        cache.maxSize = 2 * 2**20 / 3
+        cache.evict()
+        self.assertIsNone(cache.get(0))
+        self.assertIsNone(cache.get(1))
+        self.assertIsNotNone(cache.get(2))
+
+
+    def test_delete(self):
+        cache = DiskCache(self.directory, maxSize=2**20)
+        cache.set("key", 1)
+        cache.set("other", 2)
+        cache.delete("key")
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.get("other"), 2)
+        self.assertEqual(cache._size, cache.size())
+
+
+    def test_overwrite(self):
+        cache = DiskCache(self.directory, maxSize=2**20)
+        cache.set("key", np.zeros(2**10))
+        cache.set("other", 1)
+        for _ in range(3):
+            cache.set("key", np.zeros(2**12))
+        self.assertEqual(cache._size, cache.size())
+
+
+    def test_invalid_entry(self):
+        cache = DiskCache(self.directory, maxSize=2**20)
+        with open(cache._path("key"), "wb") as entry:
+            entry.write(b"invalid")
+        self.assertIsNone(cache.get("key"))
+
+
+if __name__ == '__main__':
+    unittest.main()
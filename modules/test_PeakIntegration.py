@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testing the batched peak integration against the analysis of single peaks.
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+import unittest
+
+# third-party libs
+import numpy as np
+
+# local modules/libs
+from modules.dataanalysis.peakintegration import integrate_windows
+
+
+def analyse_single_window(xData, yData, lowerLimit, upperLimit)->tuple:
+    idxBorderRight = np.abs(xData - upperLimit).argmin()
+    idxBorderLeft = np.abs(xData - lowerLimit).argmin()
+    if idxBorderRight == 0 or idxBorderLeft >= idxBorderRight:
+        return 0.0, 0.0, 0.0
+    integrationRange = range(idxBorderLeft, idxBorderRight+1)
+    idxPeak = yData[integrationRange].argmax() + integrationRange[0]
+    x, y = xData[integrationRange], yData[integrationRange]
+    # Composite trapezoidal rule (np.trapz is not available in numpy 2).
+    area = np.sum((y[1:] + y[:-1]) * np.diff(x)) / 2
+    return area, yData[idxPeak], xData[idxPeak]
+
+
+class TestPeakIntegration(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.xData = np.arange(1024) * 0.02 + 420.0
+        self.yData = rng.normal(size=1024)
+        # Limits in the spectrum, out of range, inverted, and exactly between two data points.
+        self.lowerLimits = np.concatenate((rng.uniform(415, 445, 50), [400, 450, 430, 425.01]))
+        self.upperLimits = np.concatenate((self.lowerLimits[:50] + rng.uniform(0, 2, 50), [410, 460, 429, 425.03]))
+
+
+    def assert_single_windows(self, xData, yData):
+        _, _, areas, heights, positions = integrate_windows(xData, yData, self.lowerLimits, self.upperLimits)
+        for i, limits in enumerate(zip(self.lowerLimits, self.upperLimits)):
+            area, height, position = analyse_single_window(xData, yData, *limits)
+            self.assertAlmostEqual(areas[i], area, places=9)
+            self.assertEqual(heights[i], height)
+            self.assertEqual(positions[i], position)
+
+
+    def test_increasing_wavelength(self):
+        self.assert_single_windows(self.xData, self.yData)
+
+
+    def test_decreasing_wavelength(self):
+        self.assert_single_windows(self.xData[::-1], self.yData)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testing the sif parser with the examples of sif_reader.
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+import unittest
+
+# third-party libs
+import numpy as np
+
+# local modules/libs
+from modules.filehandling.filereading.sifparser import np_open, iter_frames, read_header
+
+# constants
+EXAMPLE_DIR = "./dependencies/sif_reader/testings/"
+
+
+class TestSifParser(unittest.TestCase):
+
+    def test_image(self):
+        data, info = np_open(EXAMPLE_DIR + "examples/image.sif")
+        expected = np.load(EXAMPLE_DIR + "examples/image.npy")
+        np.testing.assert_array_equal(data, expected)
+        self.assertEqual(info["NumberOfFrames"], 1)
+        self.assertEqual(info["DetectorDimensions"], (512, 512))
+
+
+    def test_calibration(self):
+        data, info = np_open(EXAMPLE_DIR + "examples_with_calibration/raman1.sif")
+        self.assertEqual(data.shape, (1, 1, 1024))
+        self.assertEqual(len(info["Calibration_data"]), 4)
+
+
+    def test_frames(self):
+        filename = EXAMPLE_DIR + "examples/image.sif"
+        data, info = np_open(filename)
+        frames = list(iter_frames(filename))
+        self.assertEqual(len(frames), info["NumberOfFrames"])
+        for idx, frameInfo, frame in frames:
+            np.testing.assert_array_equal(frame, data[idx])
+        self.assertEqual(read_header(filename)[-1], info)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testing the SpectrumHandler, which must be usable without ui and in worker processes.
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+import pickle
+import unittest
+
+# third-party libs
+import numpy as np
+
+# local modules/libs
+from c_enum.characteristic import CHARACTERISTIC as CHC
+from c_types.basicsetting import BasicSetting
+from loader.fittingregistry import FittingRegistry
+from modules.dataanalysis.spectrumhandler import SpectrumHandler, estimate_baselines
+from modules.filehandling.filereading.filereader import FileReader
+
+
+SAMPLE_FILE = "./sample files/BH-Peak-Analysis_433nm.asc"
+FITTING_FILE = "./fittings/boron_fitting.yml"
+
+
+class TestSpectrumHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.setting = setting = BasicSetting(wavelength=433.0, dispersion=1.0, invertSpectrum=False,
+                               selectedFitting=None, checkedFittings=[],
+                               baselineCorrection=True, normalizeData=False, calibration=False)
+        self.file = FileReader(SAMPLE_FILE)
+        self.specHandler = SpectrumHandler(self.file, setting, useFileWavelength=True)
+
+
+    def test_pickle(self):
+        clone = pickle.loads(pickle.dumps(self.specHandler))
+        np.testing.assert_array_equal(clone.procXData, self.specHandler.procXData)
+        np.testing.assert_array_equal(clone.procYData, self.specHandler.procYData)
+        self.assertEqual(clone.xDataArePixel, self.specHandler.xDataArePixel)
+
+
+    def test_results_without_fitting(self):
+        results = self.specHandler.results
+        self.assertIsNone(results[CHC.FITTING_FILE])
+
+
+    def test_stacked_baseline(self):
+        rawYData = self.specHandler.rawYData
+        stack = np.array([rawYData, 2 * rawYData, np.zeros_like(rawYData)])
+        baselines = estimate_baselines(stack, invertSpectrum=False)
+        np.testing.assert_allclose(baselines[0], self.specHandler.baseline)
+
+        specHandler = SpectrumHandler(self.file, self.setting, useFileWavelength=True, baseline=baselines[0])
+        np.testing.assert_allclose(specHandler.procYData, self.specHandler.procYData)
+        np.testing.assert_allclose(baselines[1], 2 * self.specHandler.baseline)
+
+
+    def test_fit_state(self):
+        fitting = FittingRegistry().get_fitting(FITTING_FILE)
+        self.specHandler.fit_data(fitting)
+        state = pickle.loads(pickle.dumps(self.specHandler.get_fit_state()))
+
+        specHandler = SpectrumHandler(self.file, self.setting, useFileWavelength=True)
+        specHandler.set_fit_state(fitting, state)
+        self.assertEqual(specHandler.results, self.specHandler.results)
+        # Peak and reference peak, raw and processed each.
+        self.assertEqual(len(specHandler.integration), 4)
+        for restored, fitted in zip(specHandler.integration, self.specHandler.integration):
+            np.testing.assert_array_equal(restored.data, fitted.data)
+            self.assertEqual(restored.peakType, fitted.peakType)
+            self.assertEqual(restored.spectrumType, fitted.spectrumType)
+
+
+if __name__ == '__main__':
+    unittest.main()
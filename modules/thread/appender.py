@@ -23,6 +23,7 @@ from c_types.basicsetting import BasicSetting
 
 # exceptions
 from exception.InvalidSpectrumError import InvalidSpectrumError
+from exception.InvalidBatchFileError import InvalidBatchFileError
 
 
 
@@ -46,6 +47,10 @@ class Appender(Worker):
             return
 
         data, header = Analysis.analyze_file(self._setting, specHandler, self._file)
-        BatchWriter(self._batchFile).extend_data(data, header)
+        try:
+            BatchWriter(self._batchFile).extend_data(data, header)
+        except InvalidBatchFileError as e:
+            self._logger.warning(e)
+            return
         self.fileValidated.emit(self._file.filename)
         self.importBatchTriggered.emit(True)
@@ -13,63 +13,44 @@ from PyQt5.QtCore import Signal
 
 # local modules/libs
 from .worker import Worker
-import modules.dataanalysis.analysis as Analysis
-from ..dataanalysis.spectrumhandler import SpectrumHandler
-from ..filehandling.filereading.filereader import FileReader
-from ..filehandling.filewriting.batchwriter import BatchWriter
+from ..batchexport import export_batch, update_batch
+from loader.configloader import ConfigLoader
 
 # type
 from c_types.basicsetting import BasicSetting
 
-# exceptions
-from exception.InvalidSpectrumError import InvalidSpectrumError
-from exception.CalibrationError import CalibrationError
-
 import time
 
 class Exporter(Worker):
     progressChanged = Signal(float)
     skippedFilesTriggered = Signal(list)
 
-    def export(self, files:list, batchFile:str, setting:BasicSetting):
+    def export(self, files:list, batchFile:str, setting:BasicSetting, processes:int=None, resume:bool=False,
+               incremental:bool=False):
+        """
+        Analyzes the files and exports the results into the batchfile.
+
+        processes: Number of worker processes. Defaults to the configuration (1: no pool).
+        resume: Resumes an interrupted export of the same files and setting.
+        incremental: Analyzes only the files which are new or modified since the last export.
+        """
         self._files = files
         self._batchFile = batchFile
         self._setting = setting
+        self._processes = ConfigLoader().processes if processes is None else processes
+        self._resume = resume
+        self._incremental = incremental
         self.start()
 
     def run(self):
-        data = []
-        header = []
-        skippedFiles = []
-
-        amount = len(self._files)
-
         before = time.perf_counter()
-        for i, file in enumerate(self._files):
-            if self.cancel:
-                break
-            self.progressChanged.emit((i+1)/amount)
-
-            try:
-                self.currentFile = FileReader(file)
-            except FileNotFoundError:
-                skippedFiles.append(file)
-                continue
-
-            if not self.currentFile.is_analyzable():
-                skippedFiles.append(file)
-                continue
-
-            try:
-                specHandler = SpectrumHandler(self.currentFile, self._setting, useFileWavelength=True)
-            except InvalidSpectrumError:
-                skippedFiles.append(file)
-                continue
-
-            fileData, header = Analysis.analyze_file(self._setting, specHandler, self.currentFile)
-            data.extend(fileData)
-
-        BatchWriter(self._batchFile).export(data, header)
+        if self._incremental:
+            skippedFiles, _ = update_batch(self._files, self._batchFile, self._setting, self._processes,
+                                        progress=self.progressChanged.emit, isCancelled=self.is_cancelled)
+        else:
+            skippedFiles, _ = export_batch(self._files, self._batchFile, self._setting, self._processes,
+                                        progress=self.progressChanged.emit, isCancelled=self.is_cancelled,
+                                        resume=self._resume)
         after = time.perf_counter()
         print("Elapsed time:", after-before)
 
@@ -7,6 +7,7 @@ Created on Fri Jan 29 14:59:28 2021
 """
 
 # standard libs
+import logging
 
 # third-party libs
 from PyQt5.QtCore import Slot, QThread
@@ -28,9 +29,14 @@ class Worker(QThread):
 
     def __init__(self):
         super().__init__()
+        self._logger = logging.getLogger(self.__class__.__name__)
         self.cancel = False
 
 
+    def is_cancelled(self)->bool:
+        return self.cancel
+
+
     def __del__(self)->None:
         """Waits until the threads stopped processing and the delete it."""
         self.wait()
@@ -11,12 +11,12 @@ import os
 import numpy as np
 from enum import Enum
 from datetime import datetime, timedelta
-from collections import Iterable
+from collections.abc import Iterable
 
 # third-party libs
-from PyQt5.QtCore import QFileInfo, QUrl, QDir
 
 # local modules/libs
+from modules.filehandling.filereading.readerregistry import ReaderRegistry
 
 # Enums
 from c_enum.suffices import SUFFICES as SUFF
@@ -38,9 +38,9 @@ def format_suffix(suffix:(str, Enum))->str:
 
 
 def is_valid_suffix(filename:str)->bool:
-    """Valid suffices are defined in 'SUFFICES'."""
+    """Valid suffices are defined in 'SUFFICES' or registered by a reader."""
     _, _, suffix = extract_path_basename_suffix(filename)
-    return SUFF.has_value(suffix)
+    return SUFF.has_value(suffix) or ReaderRegistry().has_reader(suffix)
 
 
 def replace_suffix(filename:str, suffix:str)->str:
@@ -54,16 +54,21 @@ def replace_suffix(filename:str, suffix:str)->str:
 #%% urls/filename
 
 def extract_path_basename_suffix(filename:str)->(str, str, str):
-    fileInfo = QFileInfo(filename)
-    absolutePath = QDir.toNativeSeparators(fileInfo.absolutePath())
-    baseName = fileInfo.baseName()
-    suffix = fileInfo.completeSuffix().lower()
-    return absolutePath, baseName, suffix
+    """
+    Splits the filename into the absolute path, the basename and the (lower case) suffix.
+
+    The basename ends at the first dot, the suffix contains everything after it.
+    """
+    if not filename:
+        return "", "", ""
+    absolutePath, fullName = os.path.split(os.path.abspath(filename))
+    baseName, _, suffix = fullName.partition(".")
+    return absolutePath, baseName, suffix.lower()
 
 
-def get_valid_local_url(url:QUrl)->str:
+def get_valid_local_url(url)->str:
     """
-    Checks whether the url is valid and has a valid suffix.
+    Checks whether the url (QUrl) is valid and has a valid suffix.
 
     Returns
     -------
@@ -94,9 +99,8 @@ def reduce_path(path:str)->str:
         (directory + filename)
 
     """
-    info = QFileInfo(path)
-    dirname = info.absoluteDir().dirName()
-    filename = info.fileName()
+    absolutePath, filename = os.path.split(os.path.abspath(path))
+    dirname = os.path.basename(absolutePath)
     filepath = dirname + os.sep + filename
     return filepath
 
@@ -37,4 +37,8 @@ def main():
 
     # Execute the app as system application. If executed, close the application accordingly.
     sys.exit(app.exec_())
-main()
+
+
+# Worker processes of the batch analysis import this module as well, but must not start the GUI.
+if __name__ == "__main__":
+    main()
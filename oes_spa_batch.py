@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OES-Spectra-Analysis: headless batch analysis.
+
+Analyzes multiple spectra and exports the characteristic values into a batchfile
+without the GUI. PyQt is not imported, so it can be run on nodes without a display
+server.
+
+Usage:
+    python oes_spa_batch.py "./sample files/" "./data/*.asc" -b ./_batch.ba -f ./fittings/methan_fitting.yml
+    python oes_spa_batch.py --help
+
+@author: Hauke Wernecke
+"""
+
+# standard libs
+import argparse
+import logging
+import os
+import sys
+import time
+
+# local modules/libs
+from loader.configloader import ConfigLoader
+
+# constants
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DEFAULT_CONFIG = "./config.yml"
+
+
+def parse_arguments(argv:list=None)->argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Headless batch analysis of OES spectra.")
+    parser.add_argument("spectra", nargs="+",
+                        help="Directories, files or glob patterns of the spectra.")
+    parser.add_argument("-b", "--batchfile", required=True,
+                        help="The batchfile (.ba) the results are exported to.")
+    parser.add_argument("-c", "--config", default=DEFAULT_CONFIG,
+                        help="The configuration file. Default: %(default)s")
+    parser.add_argument("-f", "--fittings", nargs="+", default=None,
+                        help="Fitting files. Default: The checked fittings of the configuration.")
+    parser.add_argument("-p", "--processes", type=int, default=None,
+                        help="Number of worker processes (0: all cores). Default: see configuration.")
+    parser.add_argument("--wavelength", type=float, default=None,
+                        help="Central wavelength if not provided by the file. Default: see configuration.")
+    parser.add_argument("--dispersion", type=float, default=None,
+                        help="Dispersion for spectra in pixel. Default: see configuration.")
+    parser.add_argument("--invert", action="store_true", help="Invert the spectra.")
+    parser.add_argument("--no-baseline-correction", action="store_true", help="Disable the baseline correction.")
+    parser.add_argument("--normalize", action="store_true", help="Normalize the spectra to the baseline.")
+    parser.add_argument("--no-calibration", action="store_true", help="Disable the calibration.")
+    parser.add_argument("--resume", action="store_true",
+                        help="Resume an interrupted export of the same spectra and setting.")
+    parser.add_argument("--update", action="store_true",
+                        help="Analyze only spectra which are new or modified since the last export.")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="Remove all cached results of the analysis (see RESULT_CACHE_DIR).")
+    return parser.parse_args(argv)
+
+
+def main(argv:list=None)->int:
+    """Main program"""
+    args = parse_arguments(argv)
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, handlers=[logging.StreamHandler(sys.stderr)])
+
+    if not os.path.isfile(args.config):
+        logging.error("Configuration not found: %s", args.config)
+        return 1
+
+    # The configuration has to be loaded before the modules which access it on import.
+    config = ConfigLoader(args.config)
+    from modules import batchexport
+    from modules.dataanalysis import resultcache
+
+    if args.clear_cache:
+        resultcache.clear()
+
+    files = batchexport.collect_files(args.spectra)
+    fittingFiles = args.fittings or batchexport.checked_fitting_files()
+    fittings = batchexport.load_fittings(fittingFiles)
+    if not files or not fittings:
+        logging.error("No spectra (%i) or no valid fittings (%i) found.", len(files), len(fittings))
+        return 1
+
+    overrides = {
+        "invertSpectrum": args.invert,
+        "baselineCorrection": not args.no_baseline_correction,
+        "normalizeData": args.normalize,
+    }
+    if args.wavelength is not None:
+        overrides["wavelength"] = args.wavelength
+    if args.dispersion is not None:
+        overrides["dispersion"] = args.dispersion
+    if args.no_calibration:
+        overrides["calibration"] = False
+    setting = batchexport.setting_from_config(fittings, **overrides)
+
+    processes = config.processes if args.processes is None else args.processes
+
+    before = time.perf_counter()
+    if args.update:
+        skippedFiles, noAnalyzedFiles = batchexport.update_batch(files, args.batchfile, setting, processes)
+    else:
+        skippedFiles, noAnalyzedFiles = batchexport.export_batch(files, args.batchfile, setting, processes, resume=args.resume)
+    after = time.perf_counter()
+
+    logging.info("Analyzed %i files in %.2f s.", noAnalyzedFiles, after-before)
+    for file in skippedFiles:
+        logging.info("Skipped file: %s", file)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
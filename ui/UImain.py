@@ -32,7 +32,7 @@ from PyQt5.QtCore import QObject, pyqtSlot
 from .ui_main_window import Ui_main
 from .matplotlibwidget import MatplotlibWidget
 from loader.configloader import ConfigLoader
-from loader.yamlloader import YamlLoader
+from loader.fittingregistry import FittingRegistry
 import modules.universal as uni
 from modules.dataanalysis.fitting import Fitting
 from modules.dataanalysis.spectrumhandler import SpectrumHandler
@@ -347,8 +347,13 @@ class UIMain(Ui_main, QObject):
         self.cbNormalizeData.stateChanged.connect(fun)
         self.rcbCalibration.stateChanged.connect(fun)
         self.clistFitting.itemClicked.connect(fun)
+
+        def reload_fitting(path:str)->None:
+            FittingRegistry().invalidate(path)
+            fun(path)
+
         # Activate Watchdog to detect changes in fitting files.
-        self._wd = FittingWatchdog(fun, directory=self.FITTING["DIR"])
+        self._wd = FittingWatchdog(reload_fitting, directory=self.FITTING["DIR"])
         self._wd.start()
 
 
@@ -407,9 +412,7 @@ class UIMain(Ui_main, QObject):
                     # loading the parameter and set up the dict using the
                     # filename and the name of the fitting
                     path = os.path.join(self.FITTING["DIR"], file)
-                    fitConfig = YamlLoader(path)
-
-                    fit = fitConfig.config.get("NAME", "no name def.")
+                    fit = FittingRegistry().get_name(path, "no name def.")
                     fitDict[file] = fit
 
         return fitDict
@@ -430,9 +433,14 @@ class UIMain(Ui_main, QObject):
         self._logger.info("Load fitting: %s", fittingName)
 
         filename = self._get_filename_of_fitting(fittingName)
-        fitConfig = self._load_fitting_configuration(filename)
         try:
-            activeFitting = Fitting(fitConfig.config, filename)
+            path = os.path.join(self.FITTING["DIR"], filename)
+        except TypeError:
+            # E.g. if no filename is given (no fitting is selected.)
+            return None
+
+        try:
+            activeFitting = FittingRegistry().get_fitting(path)
         except AttributeError:
             # If no config was loaded.
             return None
@@ -469,16 +477,6 @@ class UIMain(Ui_main, QObject):
         return None
 
 
-    def _load_fitting_configuration(self, filename:str)->Fitting:
-        try:
-            path = os.path.join(self.FITTING["DIR"], filename)
-        except TypeError:
-            # E.g. if no filename is given (no fitting is selected.)
-            return None
-        fitConfig = YamlLoader(path)
-        return fitConfig
-
-
     def _set_fittings_errorcode(self, fit:Fitting):
         label = uni.mark_bold_red(fit.errCode) + self.DEF_LBL_FITTING
         self.lblFitting.setText(label)
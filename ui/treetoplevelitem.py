@@ -30,7 +30,8 @@ class TreeTopLevelItem(TreeWidgetItem):
         self.setText(MultiBatchColumns.COL_FILENAME.value, uni.reduce_path(filename))
 
         # TODO: handle FileNotFoundError
-        file = BaReader(filename)
+        # Only the peak names are required.
+        file = BaReader(filename, characteristic=[])
         self.peakNames = file.data.keys()
 
 